@@ -2,10 +2,15 @@
 FastAPI endpoints for car price prediction.
 """
 
+import asyncio
+import gc
 import logging
-from pathlib import Path
+import os
+import time
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from backend.app.schemas.api_schemas import (
     PredictionRequest,
@@ -16,8 +21,10 @@ from backend.app.schemas.api_schemas import (
 from backend.app.services.llm_service import LLMService
 from backend.app.services.model_service import ModelService
 from backend.app.services.rate_limiter import DailyRateLimiter
+from backend.app.services.batching import BatchingPredictor
+from backend.app.services.cache import PredictionCache
 from backend.app.services.validation import validate_features
-from backend.app.config import MODEL_PATH
+from backend.app.config import MODEL_PATH, LLM_FUSED_PROMPT_ENABLED
 
 logger = logging.getLogger(__name__)
 
@@ -27,76 +34,138 @@ router = APIRouter()
 llm_service: LLMService = None
 model_service: Optional[ModelService] = None
 rate_limiter: DailyRateLimiter = None
+prediction_cache: Optional[PredictionCache] = None
+batching_predictor: Optional[BatchingPredictor] = None
 
 
-def set_services(llm: LLMService, model: Optional[ModelService], limiter: DailyRateLimiter):
+def set_services(
+    llm: LLMService,
+    model: Optional[ModelService],
+    limiter: DailyRateLimiter,
+    cache: Optional[PredictionCache] = None,
+    predictor: Optional[BatchingPredictor] = None,
+):
     """Set service instances (called from main app)."""
-    global llm_service, model_service, rate_limiter
+    global llm_service, model_service, rate_limiter, prediction_cache, batching_predictor
     llm_service = llm
     model_service = model
     rate_limiter = limiter
+    prediction_cache = cache
+    batching_predictor = predictor
+    _refresh_health_payload()
 
 
-def _load_model_if_needed():
+# Pre-serialized /health body, rebuilt only when service availability changes
+_health_payload: bytes = b""
+
+
+def _refresh_health_payload():
+    """Rebuild the cached /health response body from the current services."""
+    global _health_payload
+    _health_payload = HealthResponse(
+        status="healthy",
+        model_loaded=model_service is not None,
+        llm_configured=llm_service is not None,
+    ).model_dump_json().encode()
+
+
+# Resolved once; every lazy load and existence check reuses the same string
+_MODEL_PATH_STR = str(MODEL_PATH)
+
+if not os.path.exists(_MODEL_PATH_STR):
+    logger.warning(f"Model file not found: {_MODEL_PATH_STR}")
+
+# Serializes lazy loads so concurrent first requests load the model only once
+_load_lock = asyncio.Lock()
+
+
+def _load_model():
+    """Load the ML model (blocking; run in a worker thread)."""
+    global model_service
+
+    logger.info("Lazy loading ML model on first request...")
+
+    # ModelService raises FileNotFoundError itself if the file is missing
+    model_service = ModelService(model_path=_MODEL_PATH_STR)
+    _refresh_health_payload()
+    logger.info("ML model loaded successfully")
+
+
+async def _load_model_if_needed():
     """
     Lazy load the ML model on first prediction request.
     This reduces startup memory usage and allows the app to start within 256MB.
     """
-    global model_service
-
     if model_service is None:
-        logger.info("Lazy loading ML model on first request...")
+        async with _load_lock:
+            # Another request may have finished loading while we waited
+            if model_service is None:
+                await asyncio.to_thread(_load_model)
 
-        if not Path(MODEL_PATH).exists():
-            logger.error(f"Model file not found: {MODEL_PATH}")
-            raise FileNotFoundError(f"Model file not found: {MODEL_PATH}")
+    return model_service
 
-        model_service = ModelService(model_path=str(MODEL_PATH))
-        logger.info("ML model loaded successfully")
 
-    return model_service
+def unload_model_if_idle(idle_timeout_sec: float) -> bool:
+    """
+    Drop the ML model if it has not been used recently.
+
+    The next prediction request lazy-loads it again.
+
+    Args:
+        idle_timeout_sec: Idle time after which the model is unloaded
+
+    Returns:
+        True if the model was unloaded
+    """
+    global model_service
 
+    if model_service is None or model_service.idle_seconds < idle_timeout_sec:
+        return False
 
-@router.get("/health", response_model=HealthResponse)
+    logger.info(f"Unloading ML model after {model_service.idle_seconds:.0f}s idle")
+    model_service = None
+    _refresh_health_payload()
+    gc.collect()
+    return True
+
+
+@router.get(
+    "/health",
+    response_class=Response,
+    responses={200: {"model": HealthResponse}},
+)
 async def health_check():
     """
     Health check endpoint.
 
+    Health checks are probed frequently, so the body is a pre-serialized
+    HealthResponse instead of being validated and encoded on every call.
+
     Returns:
         HealthResponse with API status and service availability
     """
-    return HealthResponse(
-        status="healthy",
-        model_loaded=model_service is not None,
-        llm_configured=llm_service is not None,
-    )
+    if not _health_payload:
+        _refresh_health_payload()
+    return Response(content=_health_payload, media_type="application/json")
 
 
-@router.post("/predict", response_model=PredictionResponse)
-async def predict_price(request: PredictionRequest):
+def _check_request_allowed():
     """
-    Predict car price from natural language description.
-
-    Args:
-        request: PredictionRequest with car description
-
-    Returns:
-        PredictionResponse with price prediction and warnings
+    Apply the daily rate limit and make sure the LLM service is available.
 
     Raises:
-        HTTPException: If services are not initialized or prediction fails
+        HTTPException: 429 if the daily limit is exceeded, 503 if services are not initialized
     """
     # Check rate limit first
+    # (check and increment happen atomically in try_acquire)
     if rate_limiter is not None:
-        if not rate_limiter.is_allowed():
+        if not rate_limiter.try_acquire():
             remaining = rate_limiter.get_remaining()
             logger.warning(f"Rate limit exceeded. Remaining: {remaining}")
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Daily request limit exceeded. Please try again tomorrow. (Limit: {rate_limiter.max_requests_per_day} requests/day)",
             )
-        # Increment counter after check passes
-        rate_limiter.increment()
 
     # Check LLM service is initialized
     if llm_service is None:
@@ -106,57 +175,251 @@ async def predict_price(request: PredictionRequest):
             detail="Services not initialized. Please try again later.",
         )
 
+
+def _prediction_error(e: Exception) -> HTTPException:
+    """Map a pipeline exception to the HTTP error returned to the client."""
+    if isinstance(e, ValueError):
+        # LLM extraction or validation errors
+        logger.error(f"Validation error: {str(e)}", exc_info=True)
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid input: {str(e)}",
+        )
+
+    # Unexpected errors
+    logger.error(f"Prediction failed: {str(e)}", exc_info=True)
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=f"Prediction failed: {str(e)}",
+    )
+
+
+async def _aextract_with_summary(description: str) -> tuple[dict, Optional[str]]:
+    """
+    Extract features and the friendly summary in one Gemini call if possible.
+
+    Returns:
+        Tuple of (features, summary). The summary is None if the features
+        came from the extraction cache or from a plain extraction call after
+        the combined call failed.
+    """
+    # The combined call only writes the extraction cache, so check it here;
+    # on a hit the (often templated) summary is produced separately
+    features = llm_service.get_cached_features(description)
+    if features is not None:
+        return features, None
+
     try:
-        # Lazy load ML model on first request
-        model = _load_model_if_needed()
-        # Step 1: Extract features from natural language
-        logger.info(f"Extracting features from: {request.description[:100]}...")
-        features = llm_service.extract_car_features(request.description)
-        logger.info(f"Extracted features: {features}")
-        logger.info("Features extracted successfully")
-
-        # Step 2: Validate features and get warnings
-        logger.info("Validating features...")
-        validated_features, warnings = validate_features(features)
-        logger.info(f"Validation complete with {len(warnings)} warnings")
-
-        # Step 3: Make prediction
-        logger.info("Making price prediction...")
-        prediction = model.predict(validated_features.model_dump())
-        logger.info(f"Prediction successful: ${prediction['price']:,}")
-
-        # Step 4: Generate friendly summary
-        logger.info("Generating friendly summary...")
-        friendly_summary = llm_service.generate_friendly_response(
-            user_description=request.description,
-            price_min=prediction["price_min"],
-            price_max=prediction["price_max"],
-            warnings=warnings,
+        return await llm_service.aextract_and_summarize(description)
+    except ValueError as e:
+        logger.warning(f"Combined extraction failed, falling back to separate calls: {str(e)}")
+        return await llm_service.aextract_car_features(description), None
+
+
+async def _extract_and_predict(
+    description: str, summarize: bool = False
+) -> tuple[dict, list[str], list[int], Optional[str]]:
+    """
+    Run feature extraction, validation and the price model for a description.
+
+    Args:
+        description: User's car description
+        summarize: Also ask for the friendly summary in the extraction call
+
+    Returns:
+        Tuple of (prediction dict, warnings, perf_counter_ns timestamps t0..t3,
+        friendly summary or None if it still has to be generated)
+    """
+    # Step 1: Extract features from natural language.
+    # The (lazy) model load runs in a worker thread at the same time, so a
+    # cold start overlaps with the Gemini round-trip instead of adding to it.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Extracting features from: {description[:100]}...")
+    t0 = time.perf_counter_ns()
+    summary = None
+    if summarize:
+        (features, summary), model = await asyncio.gather(
+            _aextract_with_summary(description),
+            _load_model_if_needed(),
+        )
+    else:
+        features, model = await asyncio.gather(
+            llm_service.aextract_car_features(description),
+            _load_model_if_needed(),
+        )
+    t1 = time.perf_counter_ns()
+    if debug:
+        logger.debug(f"Extracted features: {features}")
+
+    # Step 2: Validate features and get warnings
+    validated_features, warnings = validate_features(features)
+    t2 = time.perf_counter_ns()
+
+    # Step 3: Make prediction (CPU-bound, keep it off the event loop)
+    if batching_predictor is not None:
+        prediction = await batching_predictor.predict(model, validated_features)
+    else:
+        prediction = await asyncio.to_thread(model.predict, validated_features)
+    t3 = time.perf_counter_ns()
+
+    return prediction, warnings, [t0, t1, t2, t3], summary
+
+
+def _log_prediction(prediction: dict, warnings: list[str], timings: list[int]):
+    """Log one record per request instead of one per step."""
+    t0, t1, t2, t3, t4 = timings
+    logger.info(
+        f"Prediction complete: price=${prediction['price']:,} warnings={len(warnings)} "
+        f"extract_ms={(t1 - t0) / 1e6:.1f} validate_ms={(t2 - t1) / 1e6:.1f} "
+        f"predict_ms={(t3 - t2) / 1e6:.1f} summary_ms={(t4 - t3) / 1e6:.1f}"
+    )
+
+
+@router.post("/predict", responses={200: {"model": PredictionResponse}})
+async def predict_price(request: PredictionRequest):
+    """
+    Predict car price from natural language description.
+
+    The response values come from our own services, so the body is encoded
+    directly rather than re-validated through PredictionResponse (which is
+    kept for the OpenAPI docs).
+
+    Args:
+        request: PredictionRequest with car description
+
+    Returns:
+        PredictionResponse with price prediction and warnings
+
+    Raises:
+        HTTPException: If services are not initialized or prediction fails
+    """
+    _check_request_allowed()
+
+    try:
+        # Repeated descriptions skip the whole pipeline
+        if prediction_cache is not None:
+            cached = await prediction_cache.aget(request.description)
+            if cached is not None:
+                logger.info("Prediction served from cache")
+                return ORJSONResponse(cached)
+
+        prediction, warnings, timings, friendly_summary = await _extract_and_predict(
+            request.description, summarize=LLM_FUSED_PROMPT_ENABLED
         )
-        logger.info("Friendly summary generated")
+
+        # Step 4: Generate friendly summary (unless the extraction call wrote it)
+        if friendly_summary is None:
+            friendly_summary = await llm_service.agenerate_friendly_response(
+                user_description=request.description,
+                price_min=prediction["price_min"],
+                price_max=prediction["price_max"],
+                warnings=warnings,
+            )
+        timings.append(time.perf_counter_ns())
+        _log_prediction(prediction, warnings, timings)
 
         # Step 5: Build response
-        return PredictionResponse(
-            price=prediction["price"],
+        result = {
+            "price": prediction["price"],
+            "price_min": prediction["price_min"],
+            "price_max": prediction["price_max"],
+            "confidence": prediction["confidence"],
+            "warnings": warnings,
+            "friendly_summary": friendly_summary,
+        }
+        if prediction_cache is not None:
+            await prediction_cache.aset(request.description, result)
+
+        return ORJSONResponse(result)
+
+    except Exception as e:
+        raise _prediction_error(e)
+
+
+def _ndjson_event(event: str, data=None) -> bytes:
+    """Encode one event line of the /predict/stream response."""
+    payload = {"event": event} if data is None else {"event": event, "data": data}
+    return orjson.dumps(payload) + b"\n"
+
+
+@router.post("/predict/stream")
+async def predict_price_stream(request: PredictionRequest):
+    """
+    Predict car price and stream the friendly summary as it is generated.
+
+    The response is newline-delimited JSON. The first line is a
+    {"event": "prediction"} event with price, price_min, price_max, confidence
+    and warnings, so the price can be shown right away. It is followed by
+    {"event": "summary_delta"} events carrying pieces of the summary text and
+    a final {"event": "done"} event.
+
+    Args:
+        request: PredictionRequest with car description
+
+    Returns:
+        StreamingResponse with application/x-ndjson events
+
+    Raises:
+        HTTPException: If services are not initialized or prediction fails
+            (before any event has been sent)
+    """
+    _check_request_allowed()
+
+    try:
+        cached = None
+        if prediction_cache is not None:
+            cached = await prediction_cache.aget(request.description)
+
+        if cached is None:
+            prediction, warnings, timings, _ = await _extract_and_predict(request.description)
+    except Exception as e:
+        raise _prediction_error(e)
+
+    if cached is not None:
+        logger.info("Prediction served from cache")
+
+        async def cached_events():
+            summary = cached["friendly_summary"]
+            yield _ndjson_event(
+                "prediction",
+                {key: value for key, value in cached.items() if key != "friendly_summary"},
+            )
+            yield _ndjson_event("summary_delta", summary)
+            yield _ndjson_event("done")
+
+        return StreamingResponse(cached_events(), media_type="application/x-ndjson")
+
+    result = {
+        "price": prediction["price"],
+        "price_min": prediction["price_min"],
+        "price_max": prediction["price_max"],
+        "confidence": prediction["confidence"],
+        "warnings": warnings,
+    }
+
+    async def events():
+        yield _ndjson_event("prediction", result)
+
+        # Step 4: Stream the friendly summary
+        chunks = []
+        async for chunk in llm_service.astream_friendly_response(
+            user_description=request.description,
             price_min=prediction["price_min"],
             price_max=prediction["price_max"],
-            confidence=prediction["confidence"],
             warnings=warnings,
-            friendly_summary=friendly_summary,
-        )
+        ):
+            chunks.append(chunk)
+            yield _ndjson_event("summary_delta", chunk)
+        timings.append(time.perf_counter_ns())
+        _log_prediction(prediction, warnings, timings)
 
-    except ValueError as e:
-        # LLM extraction or validation errors
-        logger.error(f"Validation error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid input: {str(e)}",
-        )
+        yield _ndjson_event("done")
 
-    except Exception as e:
-        # Unexpected errors
-        logger.error(f"Prediction failed: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Prediction failed: {str(e)}",
-        )
+        if prediction_cache is not None:
+            await prediction_cache.aset(
+                request.description,
+                {**result, "friendly_summary": "".join(chunks).strip()},
+            )
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
@@ -26,8 +26,77 @@ GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-2.5-flash")
 # API request rate limit (requests per day)
 RATE_LIMIT_PER_DAY = int(os.getenv("RATE_LIMIT_PER_DAY", "30"))
 
-# LLM retry attempts on failure
-LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+# Output token cap per Gemini call (per item for batched calls). Thinking
+# models (gemini-2.5-*) count their thinking tokens against it, so keep headroom
+LLM_MAX_OUTPUT_TOKENS = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "2048"))
+
+# LLM attempts per feature extraction. Extraction uses Gemini's JSON mode, so
+# retries are only needed for transient API errors
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
+# Micro-batching of concurrent LLM calls (off by default)
+# When enabled, requests arriving within LLM_BATCH_MAX_WAIT_MS of each other
+# share a single Gemini call (up to LLM_BATCH_MAX_SIZE requests per call).
+# Takes precedence over LLM_FUSED_PROMPT_ENABLED
+LLM_BATCHING_ENABLED = os.getenv("LLM_BATCHING_ENABLED", "false").lower() == "true"
+LLM_BATCH_MAX_SIZE = int(os.getenv("LLM_BATCH_MAX_SIZE", "8"))
+LLM_BATCH_MAX_WAIT_MS = int(os.getenv("LLM_BATCH_MAX_WAIT_MS", "20"))
+
+# Micro-batching of concurrent model predictions (off by default)
+# When enabled, predictions arriving within MODEL_BATCH_MAX_WAIT_MS of each
+# other run as one multi-row pipeline pass (up to MODEL_BATCH_MAX_SIZE rows)
+MODEL_BATCHING_ENABLED = os.getenv("MODEL_BATCHING_ENABLED", "false").lower() == "true"
+MODEL_BATCH_MAX_SIZE = int(os.getenv("MODEL_BATCH_MAX_SIZE", "32"))
+MODEL_BATCH_MAX_WAIT_MS = int(os.getenv("MODEL_BATCH_MAX_WAIT_MS", "5"))
+
+# Extract features and write the friendly summary in a single Gemini call
+# (falls back to separate calls if the combined response cannot be parsed).
+# Ignored with LLM_BATCHING_ENABLED: the combined prompt can't be batched, so
+# extraction and summary go through their batchers as separate calls
+# The combined call runs at temperature 0 for extraction, so its summaries are
+# worded deterministically (separate summary calls use 0.4)
+LLM_FUSED_PROMPT_ENABLED = os.getenv("LLM_FUSED_PROMPT_ENABLED", "true").lower() == "true"
+
+# Use a fixed summary instead of a Gemini call when the user described every
+# car feature (the only warnings are the seller defaults every prediction has)
+LLM_SKIP_SUMMARY_WHEN_NO_WARNINGS = os.getenv("LLM_SKIP_SUMMARY_WHEN_NO_WARNINGS", "true").lower() == "true"
+
+# Cache of /predict results keyed by normalized description (0 disables)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "1024"))
+
+# Cache of raw model predictions keyed by the validated feature values (0 disables)
+MODEL_PREDICTION_CACHE_SIZE = int(os.getenv("MODEL_PREDICTION_CACHE_SIZE", "1024"))
+
+# Cache of LLM feature extractions keyed by normalized description (0 disables).
+# Also serves /predict/stream and requests whose /predict result was evicted
+EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", "1024"))
+
+# Semantic cache tier: reuse results for near-identical descriptions by
+# embedding similarity (off by default, costs one embedding call per miss)
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.97"))
+GEMINI_EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "models/text-embedding-004")
+
+# Worker threads for CPU-bound work run off the event loop (model inference,
+# model loading). XGBoost parallelizes each predict itself, so the pool is
+# capped to avoid oversubscribing cores. Default: one per CPU core, at most 4
+THREADPOOL_MAX_WORKERS = int(os.getenv("THREADPOOL_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Load the ML model when the app module is imported instead of on the first
+# request. Set by gunicorn_conf.py so the model is loaded once in the gunicorn
+# master and shared with forked workers (copy-on-write)
+PRELOAD_MODEL = os.getenv("PRELOAD_MODEL", "false").lower() == "true"
+
+# Defer loading the ML model to the first prediction request instead of app
+# startup. Lowers startup memory on small instances at the cost of a slow first
+# request
+LAZY_LOAD_MODEL = os.getenv("LAZY_LOAD_MODEL", "false").lower() == "true"
+
+# Unload the ML model after this many seconds without predictions to free
+# memory; the next request reloads it (0 disables unloading). Ignored with
+# PRELOAD_MODEL: the gunicorn master's shared copy can't be freed by a worker
+MODEL_IDLE_UNLOAD_SEC = int(os.getenv("MODEL_IDLE_UNLOAD_SEC", "0"))
+MODEL_IDLE_CHECK_INTERVAL_SEC = 60
 
 # =============================================================================
 # PATHS (Fixed)
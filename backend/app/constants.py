@@ -40,6 +40,14 @@ INTERIOR_COLORS = [
     'Graphite', 'Titan Black', 'Tan', 'Charcoal Black', 'others'
 ]
 
+# Set versions for O(1) membership checks on the validation path
+# (the lists above keep their order for prompts and display)
+MANUFACTURERS_SET = frozenset(MANUFACTURERS)
+TRANSMISSIONS_SET = frozenset(TRANSMISSIONS)
+DRIVETRAINS_SET = frozenset(DRIVETRAINS)
+FUEL_TYPES_SET = frozenset(FUEL_TYPES)
+INTERIOR_COLORS_SET = frozenset(INTERIOR_COLORS)
+
 # =============================================================================
 # DEFAULT VALUES FOR NON-CAR FEATURES
 # =============================================================================
@@ -175,10 +183,26 @@ MPG_ESTIMATES_BY_FUEL_TYPE = {
 }
 
 # Adjustment factors based on year (newer cars tend to be more efficient)
+MPG_YEAR_FACTORS = {
+    'new': 1.1,  # 2020 and newer: 10% better efficiency
+    'mid': 1.0,
+    'old': 0.9,  # 2015 and older: 10% worse efficiency
+}
+
+# Precomputed (fuel_type, year_band) -> estimated MPG
+MPG_TABLE = {
+    (fuel_type, band): round(base_mpg * factor, 1)
+    for fuel_type, base_mpg in MPG_ESTIMATES_BY_FUEL_TYPE.items()
+    for band, factor in MPG_YEAR_FACTORS.items()
+}
+
+
 def estimate_mpg(fuel_type: str, year: int) -> float:
     """
     Estimate MPG based on fuel type and year.
 
+    Unknown fuel types use the 'others' estimate.
+
     Args:
         fuel_type: Type of fuel
         year: Model year
@@ -186,28 +210,23 @@ def estimate_mpg(fuel_type: str, year: int) -> float:
     Returns:
         Estimated MPG
     """
-    base_mpg = MPG_ESTIMATES_BY_FUEL_TYPE.get(fuel_type, 25.0)
-
-    # Apply year-based adjustment
-    if year >= 2020:
-        base_mpg *= 1.1  # 10% better efficiency for newer cars
-    elif year <= 2015:
-        base_mpg *= 0.9  # 10% worse efficiency for older cars
-
-    return round(base_mpg, 1)
+    band = 'new' if year >= 2020 else 'old' if year <= 2015 else 'mid'
+    if fuel_type not in MPG_ESTIMATES_BY_FUEL_TYPE:
+        fuel_type = 'others'
+    return MPG_TABLE[(fuel_type, band)]
 
 
 # =============================================================================
 # VALIDATION HELPERS
 # =============================================================================
 
-def validate_categorical(value: str, valid_values: list, feature_name: str) -> str:
+def validate_categorical(value: str, valid_values: frozenset, feature_name: str) -> str:
     """
     Validate categorical value and map to 'others' if invalid.
 
     Args:
         value: Value to validate
-        valid_values: List of valid values
+        valid_values: Set of valid values (e.g. MANUFACTURERS_SET)
         feature_name: Name of the feature (for error messages)
 
     Returns:
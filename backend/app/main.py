@@ -5,25 +5,45 @@ This module initializes the FastAPI app, loads ML models and services at startup
 and configures the API routes.
 """
 
-import os
+import queue
+import asyncio
 import logging
+import logging.handlers
 from pathlib import Path
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from dotenv import load_dotenv
 
-from backend.app.api.endpoints import router, set_services
+from backend.app.api.endpoints import router, set_services, unload_model_if_idle
 from backend.app.services.llm_service import LLMService
+from backend.app.services.batching import BatchingLLMService, BatchingPredictor
 from backend.app.services.model_service import ModelService
 from backend.app.services.rate_limiter import DailyRateLimiter
+from backend.app.services.cache import LRUCache, PredictionCache
 from backend.app.config import (
     GEMINI_API_KEY,
     RATE_LIMIT_PER_DAY,
     MODEL_PATH,
+    LLM_BATCHING_ENABLED,
+    LLM_BATCH_MAX_SIZE,
+    LLM_BATCH_MAX_WAIT_MS,
+    MODEL_BATCHING_ENABLED,
+    MODEL_BATCH_MAX_SIZE,
+    MODEL_BATCH_MAX_WAIT_MS,
+    PREDICTION_CACHE_SIZE,
+    EXTRACTION_CACHE_SIZE,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_THRESHOLD,
+    THREADPOOL_MAX_WORKERS,
+    MODEL_IDLE_UNLOAD_SEC,
+    MODEL_IDLE_CHECK_INTERVAL_SEC,
+    PRELOAD_MODEL,
+    LAZY_LOAD_MODEL,
     API_VERSION_PREFIX,
 )
 
@@ -35,12 +55,68 @@ logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
+
+# Set up in start_log_queue() from the lifespan, i.e. once per worker process
+_log_listener: logging.handlers.QueueListener = None
+
+
+def start_log_queue():
+    """
+    Hand log records to a background thread so request handling never blocks
+    on stream I/O; the listener writes them with the root logger's handlers.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *root_logger.handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    _log_listener.start()
+
+
+def stop_log_queue():
+    """Flush queued log records and give the root logger its handlers back."""
+    global _log_listener
+    if _log_listener is None:
+        return
+
+    _log_listener.stop()
+    logging.getLogger().handlers = list(_log_listener.handlers)
+    _log_listener = None
+
+
 logger = logging.getLogger(__name__)
 
 # Global service instances
 llm_service: LLMService = None
-model_service: ModelService = None
-rate_limiter: DailyRateLimiter = None
+batching_llm_service: BatchingLLMService = None
+batching_predictor: BatchingPredictor = None
+prediction_cache: PredictionCache = None
+
+# Created at import so that with gunicorn --preload all forked workers share
+# the limiter's counter and enforce one daily limit between them
+rate_limiter = DailyRateLimiter(max_requests_per_day=RATE_LIMIT_PER_DAY)
+
+# With PRELOAD_MODEL (gunicorn --preload), load the model at import so forked
+# workers inherit the parent's copy instead of each loading their own
+_preloaded_model: ModelService = None
+if PRELOAD_MODEL:
+    logger.info("Preloading ML model...")
+    _preloaded_model = ModelService(model_path=str(MODEL_PATH))
+
+
+async def unload_idle_model_periodically():
+    """Background task that frees the ML model after MODEL_IDLE_UNLOAD_SEC idle."""
+    while True:
+        await asyncio.sleep(MODEL_IDLE_CHECK_INTERVAL_SEC)
+        try:
+            unload_model_if_idle(MODEL_IDLE_UNLOAD_SEC)
+        except Exception as e:
+            logger.error(f"Idle model check failed: {str(e)}", exc_info=True)
 
 
 @asynccontextmanager
@@ -50,16 +126,20 @@ async def lifespan(app: FastAPI):
 
     Loads services at startup and cleans up at shutdown.
     """
-    global llm_service, model_service, rate_limiter
+    global llm_service, batching_llm_service, batching_predictor, prediction_cache
+
+    idle_unload_task = None
 
     # Startup
+    start_log_queue()
     logger.info("Starting up application...")
 
     try:
-        # Initialize rate limiter
-        logger.info("Initializing rate limiter...")
-        rate_limiter = DailyRateLimiter(max_requests_per_day=RATE_LIMIT_PER_DAY)
-        logger.info(f"Rate limiter initialized: {RATE_LIMIT_PER_DAY} requests/day")
+        # Size the executor used by asyncio.to_thread (model inference)
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=THREADPOOL_MAX_WORKERS)
+        )
+        logger.info(f"Default thread pool set to {THREADPOOL_MAX_WORKERS} workers")
 
         # Initialize LLM service
         logger.info("Initializing LLM service...")
@@ -67,27 +147,93 @@ async def lifespan(app: FastAPI):
             logger.warning("GEMINI_API_KEY not found in environment")
             raise ValueError("GEMINI_API_KEY environment variable is required")
 
-        llm_service = LLMService(api_key=GEMINI_API_KEY)
+        extraction_cache = LRUCache(EXTRACTION_CACHE_SIZE) if EXTRACTION_CACHE_SIZE > 0 else None
+        llm_service = LLMService(api_key=GEMINI_API_KEY, cache=extraction_cache)
         logger.info(f"LLM service initialized with model: {llm_service.model_name}")
 
-        # Note: Model service will be lazy-loaded on first prediction request
-        # This reduces startup memory usage from ~138MB to minimal
-        logger.info("ML model will be loaded on first prediction request (lazy loading)")
+        # Optionally coalesce concurrent LLM calls into batched requests
+        if LLM_BATCHING_ENABLED:
+            batching_llm_service = BatchingLLMService(
+                llm_service,
+                max_batch_size=LLM_BATCH_MAX_SIZE,
+                max_wait_ms=LLM_BATCH_MAX_WAIT_MS,
+            )
+            await batching_llm_service.start()
+            logger.info("LLM micro-batching enabled")
+
+        # Optionally coalesce concurrent model predictions into one pipeline pass
+        if MODEL_BATCHING_ENABLED:
+            batching_predictor = BatchingPredictor(
+                max_batch_size=MODEL_BATCH_MAX_SIZE,
+                max_wait_ms=MODEL_BATCH_MAX_WAIT_MS,
+            )
+            await batching_predictor.start()
+            logger.info("Model prediction micro-batching enabled")
+
+        # Initialize prediction cache
+        if PREDICTION_CACHE_SIZE > 0:
+            prediction_cache = PredictionCache(
+                maxsize=PREDICTION_CACHE_SIZE,
+                embed_fn=llm_service.aembed_text if SEMANTIC_CACHE_ENABLED else None,
+                similarity_threshold=SEMANTIC_CACHE_THRESHOLD,
+            )
+            logger.info(
+                f"Prediction cache initialized: {PREDICTION_CACHE_SIZE} entries "
+                f"(semantic tier {'enabled' if SEMANTIC_CACHE_ENABLED else 'disabled'})"
+            )
 
-        # Set services in endpoints (model_service=None for now)
-        set_services(llm=llm_service, model=None, limiter=rate_limiter)
+        # Load the ML model before serving so the first request doesn't pay
+        # for it (already done at import with PRELOAD_MODEL). With
+        # LAZY_LOAD_MODEL it is loaded on the first prediction request instead.
+        # Only the endpoints module keeps a reference, so an idle unload
+        # really frees it
+        model_service = _preloaded_model
+        if model_service is None:
+            if LAZY_LOAD_MODEL:
+                logger.info("ML model will be loaded on first prediction request (lazy loading)")
+            else:
+                logger.info("Loading ML model...")
+                model_service = await asyncio.to_thread(ModelService, model_path=str(MODEL_PATH))
+
+        # Set services in endpoints (model_service=None if lazy loading)
+        set_services(
+            llm=batching_llm_service or llm_service,
+            model=model_service,
+            limiter=rate_limiter,
+            cache=prediction_cache,
+            predictor=batching_predictor,
+        )
+        # This frame stays alive until shutdown; don't pin the model in it
+        del model_service
         logger.info("Services configured successfully")
 
+        # Free the model again during long idle stretches. Not with
+        # PRELOAD_MODEL: the gunicorn master keeps its copy, so a worker
+        # unload frees nothing and the reload makes a private copy per worker
+        if MODEL_IDLE_UNLOAD_SEC > 0 and PRELOAD_MODEL:
+            logger.warning("MODEL_IDLE_UNLOAD_SEC is ignored with PRELOAD_MODEL")
+        elif MODEL_IDLE_UNLOAD_SEC > 0:
+            idle_unload_task = asyncio.create_task(unload_idle_model_periodically())
+            logger.info(f"ML model will be unloaded after {MODEL_IDLE_UNLOAD_SEC}s idle")
+
         logger.info("Application startup complete")
 
     except Exception as e:
         logger.error(f"Startup failed: {str(e)}", exc_info=True)
+        stop_log_queue()
         raise
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    if idle_unload_task is not None:
+        idle_unload_task.cancel()
+    if batching_llm_service is not None:
+        await batching_llm_service.stop()
+    if batching_predictor is not None:
+        await batching_predictor.stop()
+    stop_log_queue()
 
 
 # Create FastAPI app
@@ -96,6 +242,7 @@ app = FastAPI(
     description="Predict used car prices from natural language descriptions using ML and LLM",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson encodes responses in C
 )
 
 # Add CORS middleware (allow all origins for development)
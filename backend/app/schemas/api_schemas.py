@@ -3,14 +3,15 @@ Pydantic schemas for FastAPI request/response models.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PredictionRequest(BaseModel):
     """Request model for car price prediction."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
     description: str = Field(
-        ...,
         min_length=1,
         max_length=1000,
         description="Natural language description of the car",
@@ -21,20 +22,12 @@ class PredictionRequest(BaseModel):
 class PredictionResponse(BaseModel):
     """Response model for car price prediction."""
 
-    price: int = Field(
-        ...,
-        description="Predicted price in USD"
-    )
-    price_min: int = Field(
-        ...,
-        description="Lower bound of price range (90% of predicted price)"
-    )
-    price_max: int = Field(
-        ...,
-        description="Upper bound of price range (110% of predicted price)"
-    )
+    model_config = ConfigDict(frozen=True)
+
+    price: int = Field(description="Predicted price in USD")
+    price_min: int = Field(description="Lower bound of price range (90% of predicted price)")
+    price_max: int = Field(description="Upper bound of price range (110% of predicted price)")
     confidence: float = Field(
-        ...,
         ge=0.0,
         le=1.0,
         description="Confidence score (0.0 to 1.0)"
@@ -43,36 +36,25 @@ class PredictionResponse(BaseModel):
         default_factory=list,
         description="List of warnings about missing or defaulted features"
     )
-    friendly_summary: str = Field(
-        ...,
-        description="Human-friendly explanation of the prediction results"
-    )
+    friendly_summary: str = Field(description="Human-friendly explanation of the prediction results")
 
 
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
 
-    status: str = Field(
-        ...,
-        description="API status"
-    )
-    model_loaded: bool = Field(
-        ...,
-        description="Whether ML model is loaded successfully"
-    )
-    llm_configured: bool = Field(
-        ...,
-        description="Whether LLM service is configured"
-    )
+    model_config = ConfigDict(frozen=True)
+
+    status: str = Field(description="API status")
+    model_loaded: bool = Field(description="Whether ML model is loaded successfully")
+    llm_configured: bool = Field(description="Whether LLM service is configured")
 
 
 class ErrorResponse(BaseModel):
     """Response model for error responses."""
 
-    error: str = Field(
-        ...,
-        description="Error message"
-    )
+    model_config = ConfigDict(frozen=True)
+
+    error: str = Field(description="Error message")
     detail: Optional[str] = Field(
         None,
         description="Detailed error information"
@@ -0,0 +1,311 @@
+"""
+Micro-batching for concurrent requests.
+
+Coalesces calls that arrive within a short window into a single batched call
+(e.g. one multi-prompt Gemini request instead of N single-prompt requests, or
+one multi-row model pass instead of N single-row predictions).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+from backend.app.services.llm_service import LLMService
+from backend.app.services.model_service import ModelService
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Collects submitted items and processes them in batches.
+
+    A batch is dispatched when it reaches max_batch_size items or when
+    max_wait_ms has elapsed since its first item arrived, whichever comes
+    first. Batches are dispatched as separate tasks, so a slow batch does not
+    hold up collection of the next one.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20,
+        name: str = "batcher",
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch: Async function mapping a list of items to a list of
+                results (same length and order). A result that is an Exception
+                instance is raised to that item's caller.
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for a batch to fill up
+            name: Name used in log messages
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.name = name
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the background collection task (call from the running event loop)."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run(), name=self.name)
+            logger.info(
+                f"{self.name} started: max_batch_size={self.max_batch_size}, "
+                f"max_wait_ms={self.max_wait * 1000:g}"
+            )
+
+    async def stop(self) -> None:
+        """
+        Stop collecting and wait for in-flight batches to finish.
+
+        Items submitted but not yet dispatched fail with RuntimeError, so
+        their callers don't wait forever.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                self._fail(future)
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit one item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The result for this item
+
+        Raises:
+            RuntimeError: If the batcher has not been started
+            Exception: Whatever the batch function raised for this item
+        """
+        if self._worker is None:
+            raise RuntimeError(f"{self.name} is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect items into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                task = asyncio.create_task(self._dispatch(batch))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Stopped while collecting: the batch being filled never runs
+            for _, future in batch:
+                self._fail(future)
+            raise
+
+    def _fail(self, future: asyncio.Future) -> None:
+        """Fail a pending item's future because the batcher stopped."""
+        if not future.done():
+            future.set_exception(RuntimeError(f"{self.name} stopped"))
+
+    async def _dispatch(self, batch: list) -> None:
+        """Run the batch function and resolve each item's future."""
+        items = [item for item, _ in batch]
+        logger.debug(f"{self.name} dispatching batch of {len(items)}")
+
+        try:
+            results = await self.process_batch(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name} returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            results = [e] * len(items)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # Caller went away (e.g. request cancelled)
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class BatchingLLMService:
+    """
+    LLMService wrapper that micro-batches concurrent Gemini calls.
+
+    Exposes the same async methods as LLMService, so endpoints can use either.
+    Anything not overridden here is delegated to the wrapped service.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20,
+    ):
+        """
+        Initialize the batching wrapper.
+
+        Args:
+            llm_service: Service that performs the actual Gemini calls
+            max_batch_size: Maximum number of requests combined into one call
+            max_wait_ms: Maximum time a request waits for others to join its batch
+        """
+        self.llm_service = llm_service
+        self._extraction_batcher = MicroBatcher(
+            llm_service.aextract_car_features_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="extraction-batcher",
+        )
+        self._summary_batcher = MicroBatcher(
+            llm_service.agenerate_friendly_responses_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="summary-batcher",
+        )
+
+    def __getattr__(self, name: str):
+        return getattr(self.llm_service, name)
+
+    async def start(self) -> None:
+        """Start the background batching tasks."""
+        await self._extraction_batcher.start()
+        await self._summary_batcher.start()
+
+    async def stop(self) -> None:
+        """Stop the background batching tasks."""
+        await self._extraction_batcher.stop()
+        await self._summary_batcher.stop()
+
+    def get_cached_features(self, user_input: str) -> Optional[dict]:
+        """Same as LLMService.get_cached_features (no Gemini call to batch)."""
+        return self.llm_service.get_cached_features(user_input)
+
+    async def aextract_car_features(self, user_input: str) -> dict:
+        """Batched equivalent of LLMService.aextract_car_features."""
+        if not user_input or not user_input.strip():
+            raise ValueError("User input cannot be empty")
+        return await self._extraction_batcher.submit(user_input)
+
+    async def aextract_and_summarize(self, user_input: str) -> tuple[dict, None]:
+        """
+        Batched replacement for LLMService.aextract_and_summarize.
+
+        The combined prompt can't share a Gemini call with other requests, so
+        with batching on the features go through the extraction batcher and
+        the summary is left to the (batched) summary step.
+
+        Returns:
+            Tuple of (features, None)
+        """
+        return await self.aextract_car_features(user_input), None
+
+    async def agenerate_friendly_response(
+        self,
+        user_description: str,
+        price_min: int,
+        price_max: int,
+        warnings: list[str],
+    ) -> str:
+        """Batched equivalent of LLMService.agenerate_friendly_response."""
+        summary = self.llm_service.templated_summary(warnings)
+        if summary is not None:
+            return summary
+
+        return await self._summary_batcher.submit(
+            {
+                "user_description": user_description,
+                "price_min": price_min,
+                "price_max": price_max,
+                "warnings": warnings,
+            }
+        )
+
+
+class BatchingPredictor:
+    """
+    Micro-batches concurrent ModelService.predict calls.
+
+    Predictions that arrive within max_wait_ms of each other run as a single
+    multi-row pipeline pass (ModelService.predict_batch) in a worker thread,
+    which amortizes the per-call pipeline overhead under concurrent load.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait_ms: float = 5):
+        """
+        Initialize the batching predictor.
+
+        Args:
+            max_batch_size: Maximum number of predictions per pipeline pass
+            max_wait_ms: Maximum time a prediction waits for others to join its batch
+        """
+        self._batcher = MicroBatcher(
+            self._predict_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="predict-batcher",
+        )
+
+    async def start(self) -> None:
+        """Start the background batching task."""
+        await self._batcher.start()
+
+    async def stop(self) -> None:
+        """Stop the background batching task."""
+        await self._batcher.stop()
+
+    async def predict(self, model: ModelService, features: dict) -> dict:
+        """Batched equivalent of ModelService.predict (run off the event loop)."""
+        return await self._batcher.submit((model, features))
+
+    async def _predict_batch(self, items: list) -> list:
+        """Run one predict_batch per model instance in the batch."""
+        # Normally every item uses the same model; a reload between requests
+        # can leave a batch split across two instances
+        groups: dict[ModelService, list[int]] = {}
+        for i, (model, _) in enumerate(items):
+            groups.setdefault(model, []).append(i)
+
+        results: list = [None] * len(items)
+        for model, indices in groups.items():
+            predictions = await asyncio.to_thread(
+                model.predict_batch, [items[i][1] for i in indices]
+            )
+            for i, prediction in zip(indices, predictions):
+                results[i] = prediction
+        return results
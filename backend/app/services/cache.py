@@ -0,0 +1,200 @@
+"""
+In-memory caches for prediction results.
+
+Repeated (or re-submitted) descriptions skip the whole LLM + model pipeline.
+An optional semantic tier also matches near-identical descriptions by
+embedding similarity.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Awaitable, Callable, Hashable, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_description(text: str) -> str:
+    """Normalize a description for cache lookups (lowercase, collapsed whitespace)."""
+    return " ".join(text.lower().split())
+
+
+def description_key(text: str) -> bytes:
+    """Get the exact-match cache key for a description."""
+    return blake2b(normalize_description(text).encode(), digest_size=16).digest()
+
+
+class LRUCache:
+    """
+    Simple thread-safe LRU cache backed by an OrderedDict.
+
+    Evicts the least recently used entry once maxsize is exceeded.
+    """
+
+    def __init__(self, maxsize: int = 1024, on_evict: Callable[[Hashable], None] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            on_evict: Optional callback called with the key of each evicted entry
+        """
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as recently used."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if needed."""
+        evicted = None
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+
+        if evicted is not None and self.on_evict is not None:
+            self.on_evict(evicted)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class PredictionCache:
+    """
+    Two-tier cache of /predict results keyed by description.
+
+    Tier 1 is an exact match on the normalized description hash. Tier 2
+    (enabled by passing embed_fn) compares description embeddings and reuses
+    the closest cached result if its cosine similarity reaches the threshold.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        embed_fn: Optional[Callable[[str], Awaitable[Sequence[float]]]] = None,
+        similarity_threshold: float = 0.97,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            embed_fn: Async function returning an embedding for a text.
+                If None, only exact matches are used.
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self._results = LRUCache(maxsize, on_evict=self._release_slot)
+
+        # Semantic tier: one row of unit-norm embeddings per cached result
+        self._embeddings = LRUCache(maxsize)
+        self._matrix: Optional[np.ndarray] = None
+        self._slot_keys: list[Optional[bytes]] = [None] * maxsize
+        self._slots: dict[bytes, int] = {}
+        self._free_slots = list(range(maxsize - 1, -1, -1))
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.embed_fn is not None
+
+    async def aget(self, description: str) -> Optional[dict]:
+        """
+        Look up a cached result for a description.
+
+        Args:
+            description: User's car description
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        key = description_key(description)
+        result = self._results.get(key)
+        if result is not None or not self.semantic_enabled or not self._slots:
+            return result
+
+        try:
+            query = await self._embedding(key, description)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {str(e)}")
+            return None
+
+        similarities = self._matrix @ query
+        best = int(np.argmax(similarities))
+        best_key = self._slot_keys[best]
+        if best_key is None or similarities[best] < self.similarity_threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit (similarity={similarities[best]:.3f})")
+        return self._results.get(best_key)
+
+    async def aset(self, description: str, result: dict) -> None:
+        """
+        Cache the result for a description.
+
+        Args:
+            description: User's car description
+            result: Result to cache
+        """
+        key = description_key(description)
+
+        # Store first so an eviction frees its matrix row for this entry
+        self._results.set(key, result)
+
+        if self.semantic_enabled and key not in self._slots:
+            try:
+                vector = await self._embedding(key, description)
+            except Exception as e:
+                logger.warning(f"Failed to embed description for semantic cache: {str(e)}")
+            else:
+                self._store_embedding(key, vector)
+
+    async def _embedding(self, key: bytes, description: str) -> np.ndarray:
+        """Get the unit-norm embedding of a description (memoized per key)."""
+        vector = self._embeddings.get(key)
+        if vector is None:
+            raw = await self.embed_fn(normalize_description(description))
+            vector = np.asarray(raw, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+            self._embeddings.set(key, vector)
+        return vector
+
+    def _store_embedding(self, key: bytes, vector: np.ndarray) -> None:
+        """Place an embedding in a free row of the similarity matrix."""
+        if self._matrix is None:
+            self._matrix = np.zeros((len(self._slot_keys), vector.shape[0]), dtype=np.float32)
+        if not self._free_slots:
+            return
+
+        slot = self._free_slots.pop()
+        self._matrix[slot] = vector
+        self._slot_keys[slot] = key
+        self._slots[key] = slot
+
+    def _release_slot(self, key: bytes) -> None:
+        """Free the matrix row of an evicted result."""
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._matrix[slot] = 0
+            self._slot_keys[slot] = None
+            self._free_slots.append(slot)
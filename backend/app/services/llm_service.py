@@ -5,20 +5,39 @@ This service uses Google Gemini API to parse user descriptions and extract
 the 14 features required by the XGBoost model.
 """
 
-import json
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, AsyncIterator, List, Optional, Union
+import orjson
 import google.generativeai as genai
 
-from backend.app.config import GEMINI_MODEL_NAME, LLM_MAX_RETRIES
+from backend.app.config import (
+    GEMINI_MODEL_NAME,
+    GEMINI_EMBEDDING_MODEL,
+    LLM_MAX_RETRIES,
+    LLM_MAX_OUTPUT_TOKENS,
+    LLM_BATCH_MAX_SIZE,
+    LLM_SKIP_SUMMARY_WHEN_NO_WARNINGS,
+)
+from backend.app.services.cache import LRUCache, description_key
+from backend.app.services.validation import SELLER_DEFAULT_WARNINGS
 from backend.app.constants import (
     MANUFACTURERS,
     TRANSMISSIONS,
     DRIVETRAINS,
     FUEL_TYPES,
     INTERIOR_COLORS,
+    MANUFACTURERS_SET,
+    TRANSMISSIONS_SET,
+    DRIVETRAINS_SET,
+    FUEL_TYPES_SET,
+    INTERIOR_COLORS_SET,
     estimate_mpg,
+    validate_categorical,
     get_default_features,
+    USER_PROVIDABLE_FEATURES,
+    FEATURE_TYPES,
     YEAR_MIN,
     YEAR_MAX,
     DEFAULT_YEAR,
@@ -28,37 +47,123 @@ from backend.app.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Outermost JSON object / array in an LLM response (greedy, so nested
+# braces are kept and any markdown fences around the JSON are left out)
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+
+# =============================================================================
+# STRUCTURED OUTPUT
+# Extraction calls run in Gemini's JSON mode with a response schema, so the
+# reply is always well-formed JSON with every feature key (null if unknown).
+# They also run at temperature 0: the same description extracts to the same
+# features, which keeps the extraction cache consistent.
+# The valid categorical values are sent as schema enums instead of being
+# spelled out in the prompt text
+# =============================================================================
+
+# Valid values per categorical feature (order kept for the schema enums)
+_CATEGORICAL_VALUES = {
+    'manufacturer': MANUFACTURERS,
+    'transmission': TRANSMISSIONS,
+    'drivetrain': DRIVETRAINS,
+    'fuel_type': FUEL_TYPES,
+    'interior_color': INTERIOR_COLORS,
+}
+
+_CATEGORICAL_SETS = {
+    'manufacturer': MANUFACTURERS_SET,
+    'transmission': TRANSMISSIONS_SET,
+    'drivetrain': DRIVETRAINS_SET,
+    'fuel_type': FUEL_TYPES_SET,
+    'interior_color': INTERIOR_COLORS_SET,
+}
+
+# Schema types of the other features ('mpg' is the one NUMBER)
+_SCHEMA_TYPES = {
+    'binary': genai.protos.Type.INTEGER,
+    'numeric': genai.protos.Type.INTEGER,
+}
+
+
+def _feature_schema(name: str) -> genai.protos.Schema:
+    """Build the nullable response schema for one extracted feature."""
+    if name in _CATEGORICAL_VALUES:
+        return genai.protos.Schema(
+            type_=genai.protos.Type.STRING,
+            format_="enum",
+            enum=_CATEGORICAL_VALUES[name],
+            nullable=True,
+        )
+    return genai.protos.Schema(
+        type_=genai.protos.Type.NUMBER if name == 'mpg' else _SCHEMA_TYPES[FEATURE_TYPES[name]],
+        nullable=True,
+    )
 
-class LLMService:
-    """Service for extracting car features using LLM."""
 
-    def __init__(self, api_key: str, model_name: str = None):
-        """
-        Initialize LLM service.
+_FEATURES_SCHEMA = genai.protos.Schema(
+    type_=genai.protos.Type.OBJECT,
+    properties={name: _feature_schema(name) for name in USER_PROVIDABLE_FEATURES},
+    required=USER_PROVIDABLE_FEATURES,
+)
 
-        Args:
-            api_key: Google Gemini API key
-            model_name: Model to use (default: from config.GEMINI_MODEL_NAME)
-        """
-        if model_name is None:
-            model_name = GEMINI_MODEL_NAME
+# Single extraction: one features object
+_EXTRACTION_CONFIG = genai.GenerationConfig(
+    temperature=0.0,
+    max_output_tokens=LLM_MAX_OUTPUT_TOKENS,
+    response_mime_type="application/json",
+    response_schema=_FEATURES_SCHEMA,
+)
 
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model_name)
-        self.model_name = model_name
-        logger.info(f"LLMService initialized with model: {model_name}")
+# Batched extraction: one features object per description
+_BATCH_EXTRACTION_CONFIG = genai.GenerationConfig(
+    temperature=0.0,
+    max_output_tokens=LLM_MAX_OUTPUT_TOKENS * LLM_BATCH_MAX_SIZE,
+    response_mime_type="application/json",
+    response_schema=genai.protos.Schema(
+        type_=genai.protos.Type.ARRAY, items=_FEATURES_SCHEMA
+    ),
+)
 
-    def _build_extraction_prompt(self, user_input: str) -> str:
-        """
-        Build the prompt for feature extraction.
+# Combined call: {"features": ..., "summary": ...}
+# One call has one temperature, and extraction needs 0. That also makes the
+# summary written here deterministic, unlike the 0.4 of the separate summary
+# call; accepted in exchange for saving a Gemini round-trip
+_FUSED_CONFIG = genai.GenerationConfig(
+    temperature=0.0,
+    max_output_tokens=LLM_MAX_OUTPUT_TOKENS,
+    response_mime_type="application/json",
+    response_schema=genai.protos.Schema(
+        type_=genai.protos.Type.OBJECT,
+        properties={
+            "features": _FEATURES_SCHEMA,
+            "summary": genai.protos.Schema(type_=genai.protos.Type.STRING),
+        },
+        required=["features", "summary"],
+    ),
+)
 
-        Args:
-            user_input: Natural language description of the car
+# Friendly summaries: a little variety in wording, plain text
+_SUMMARY_CONFIG = genai.GenerationConfig(
+    temperature=0.4,
+    max_output_tokens=LLM_MAX_OUTPUT_TOKENS,
+)
 
-        Returns:
-            Formatted prompt string
-        """
-        prompt = f"""You are a car feature extraction assistant. Extract structured information from the user's car description.
+# Batched summaries: one summary per car in a single reply
+_BATCH_SUMMARY_CONFIG = genai.GenerationConfig(
+    temperature=0.4,
+    max_output_tokens=LLM_MAX_OUTPUT_TOKENS * LLM_BATCH_MAX_SIZE,
+)
+
+
+# =============================================================================
+# PROMPT TEMPLATES
+# Built once at import; per request only the user input and warnings are
+# spliced in between the constant head and tail
+# =============================================================================
+
+# Rules, valid values and few-shot examples shared by every extraction prompt
+_EXTRACTION_INSTRUCTIONS = f"""You are a car feature extraction assistant. Extract structured information from the user's car description.
 
 **IMPORTANT RULES:**
 1. Extract ONLY the features mentioned by the user
@@ -66,21 +171,16 @@ class LLMService:
 3. Use null for features not mentioned
 4. Map common terms to valid values (examples below)
 
-**Valid Values for Categorical Features:**
-
-manufacturer: {', '.join(MANUFACTURERS)}
-transmission: {', '.join(TRANSMISSIONS)}
-drivetrain: {', '.join(DRIVETRAINS)}
-fuel_type: {', '.join(FUEL_TYPES)}
-interior_color: {', '.join(INTERIOR_COLORS)}
+**Categorical Features:**
+manufacturer, transmission, drivetrain, fuel_type and interior_color must use one of the values allowed by the response schema.
 
 **Mapping Examples:**
 - "FWD" or "front wheel" → "front_wheel_drive"
 - "AWD" or "all wheel" → "all_wheel_drive"
 - "4WD" or "4x4" → "four_wheel_drive"
 - "RWD" or "rear wheel" → "rear_wheel_drive"
-- "automatic" → "Automatic" (find closest match in transmission list)
-- "manual" → "6-Speed Manual" (find closest match)
+- "automatic" → "Automatic" (closest allowed transmission value)
+- "manual" → "6-Speed Manual" (closest allowed transmission value)
 - "Benz" → "Mercedes-Benz"
 - Unknown values → "others"
 
@@ -144,14 +244,160 @@ Output:
   "mpg": null,
   "personal_use_only": null
 }}
+"""
+
+# Structure and tone of the friendly summary
+_SUMMARY_INSTRUCTIONS = """**Instructions:**
+Write a concise 2 paragraph response with this structure:
+
+**Paragraph 1:** Start with a simple greeting (like "Hello" or "Hi there"), then mention that using the information provided and a machine learning model, we estimated the value. DO NOT repeat the actual price numbers - they are shown separately. Just mention that the estimate was made.
+
+**Paragraph 2:** If there are considerations/warnings, explain them in user-friendly, natural language. If no considerations exist (all info was provided), just add a brief positive note about having complete information for an accurate estimate. Don't forget to explain the assumptions made (e.g., mileage, condition), when they apply.
 
+Keep it warm but concise. Don't repeat back all the features the user already told you. Write directly to the user ("your car", "based on your description")."""
+
+_EXTRACTION_PROMPT_HEAD = f"""{_EXTRACTION_INSTRUCTIONS}
 Now extract features from this description:
-"{user_input}"
+\""""
+_EXTRACTION_PROMPT_TAIL = """"
 
 Return ONLY the JSON object, no other text:"""
 
+_FUSED_PROMPT_HEAD = f"""{_EXTRACTION_INSTRUCTIONS}
+You are also a friendly car pricing assistant. Besides extracting the features, write a natural, helpful summary for the user.
+
+**Considerations for the summary:**
+- Seller rating, driver rating and driver reviews count always use average defaults
+- Features you return as null are filled with assumptions: year {DEFAULT_YEAR}, mileage {DEFAULT_MILEAGE:,} miles, a generic category for unknown manufacturer/transmission/drivetrain/fuel type/interior color, no accidents, not one owner, not personal use only, and an MPG estimated from fuel type and year
+
+{_SUMMARY_INSTRUCTIONS}
+
+Now process this description:
+\""""
+_FUSED_PROMPT_TAIL = """"
+
+Return ONLY a JSON object with two keys, no other text:
+{"features": <the extracted features object>, "summary": "<the summary text>"}"""
+
+_FRIENDLY_PROMPT_HEAD = """You are a friendly car pricing assistant. Based on the user's car description and our price analysis, write a natural, helpful summary.
+
+**User's Description:**
+\""""
+_FRIENDLY_PROMPT_MIDDLE = """"
+
+**Considerations:**
+"""
+_FRIENDLY_PROMPT_TAIL = f"""
+
+{_SUMMARY_INSTRUCTIONS}
+
+Generate the response:"""
+
+# Batched summaries: the car count is spliced in after HEAD and after TAIL
+_BATCH_FRIENDLY_PROMPT_HEAD = "You are a friendly car pricing assistant. For each of the "
+_BATCH_FRIENDLY_PROMPT_MIDDLE = """ cars below, based on the user's car description and our price analysis, write a natural, helpful summary.
+
+"""
+_BATCH_FRIENDLY_PROMPT_TAIL = f"""
+
+{_SUMMARY_INSTRUCTIONS}
+
+Write one such response for each car.
+
+Return ONLY a JSON array with exactly """
+_BATCH_FRIENDLY_PROMPT_END = " strings, one response per car and in the same order, no other text:"
+
+# Summary used without an LLM call when all car details were provided
+_COMPLETE_INFO_SUMMARY = """Hi there! Using the information you provided and our machine learning model, we estimated the value of your car.
+
+Your description covered all the key details of your car, so the estimate is based on complete information. The only assumptions are about the seller (seller rating, driver rating and number of reviews), which use typical average values."""
+
+
+class LLMService:
+    """Service for extracting car features using LLM."""
+
+    def __init__(self, api_key: str, model_name: str = None, cache: Optional[LRUCache] = None):
+        """
+        Initialize LLM service.
+
+        Args:
+            api_key: Google Gemini API key
+            model_name: Model to use (default: from config.GEMINI_MODEL_NAME)
+            cache: Optional cache of extracted features keyed by normalized
+                description. If None, every extraction calls Gemini.
+        """
+        if model_name is None:
+            model_name = GEMINI_MODEL_NAME
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+        self.model_name = model_name
+        self.cache = cache
+        logger.info(f"LLMService initialized with model: {model_name}")
+
+    def get_cached_features(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the cached features for a description, if any."""
+        if self.cache is None:
+            return None
+        features = self.cache.get(description_key(user_input))
+        if features is not None:
+            logger.debug("Feature extraction served from cache")
+            return dict(features)
+        return None
+
+    def _cache_features(self, user_input: str, features: Dict[str, Any]) -> None:
+        """Cache the extracted features for a description."""
+        if self.cache is not None:
+            self.cache.set(description_key(user_input), dict(features))
+
+    def _build_extraction_prompt(self, user_input: str) -> str:
+        """
+        Build the prompt for feature extraction.
+
+        Args:
+            user_input: Natural language description of the car
+
+        Returns:
+            Formatted prompt string
+        """
+        return f"{_EXTRACTION_PROMPT_HEAD}{user_input}{_EXTRACTION_PROMPT_TAIL}"
+
+    def _build_batch_extraction_prompt(self, user_inputs: List[str]) -> str:
+        """
+        Build a single prompt that extracts features for several descriptions.
+
+        Args:
+            user_inputs: Natural language descriptions of the cars
+
+        Returns:
+            Formatted prompt string asking for a JSON array (one object per input)
+        """
+        descriptions = "\n\n".join(
+            f'### Description {i}\n"{user_input}"'
+            for i, user_input in enumerate(user_inputs, 1)
+        )
+
+        prompt = f"""{_EXTRACTION_INSTRUCTIONS}
+Now extract features from each of these {len(user_inputs)} descriptions independently:
+
+{descriptions}
+
+Return ONLY a JSON array with exactly {len(user_inputs)} objects, one per description and in the same order, no other text:"""
+
         return prompt
 
+    def _build_fused_prompt(self, user_input: str) -> str:
+        """
+        Build a single prompt that extracts features and writes the friendly summary.
+
+        Args:
+            user_input: Natural language description of the car
+
+        Returns:
+            Formatted prompt string asking for {"features": ..., "summary": ...}
+        """
+        return f"{_FUSED_PROMPT_HEAD}{user_input}{_FUSED_PROMPT_TAIL}"
+
     def extract_car_features(
         self, user_input: str, max_retries: int = None
     ) -> Dict[str, Any]:
@@ -174,16 +420,22 @@ Return ONLY the JSON object, no other text:"""
         if max_retries is None:
             max_retries = LLM_MAX_RETRIES
 
+        cached = self.get_cached_features(user_input)
+        if cached is not None:
+            return cached
+
         prompt = self._build_extraction_prompt(user_input)
 
         # Try extraction with retries
         last_error = None
         for attempt in range(max_retries):
             try:
-                logger.info(f"Extraction attempt {attempt + 1}/{max_retries}")
+                logger.debug(f"Extraction attempt {attempt + 1}/{max_retries}")
 
                 # Call Gemini API
-                response = self.model.generate_content(prompt)
+                response = self.model.generate_content(
+                    prompt, generation_config=_EXTRACTION_CONFIG
+                )
                 response_text = response.text.strip()
 
                 # Parse JSON
@@ -191,8 +443,9 @@ Return ONLY the JSON object, no other text:"""
 
                 # Fill defaults and estimates
                 features = self._fill_missing_features(features)
+                self._cache_features(user_input, features)
 
-                logger.info("Feature extraction successful")
+                logger.debug("Feature extraction successful")
                 return features
 
             except Exception as e:
@@ -209,6 +462,196 @@ Return ONLY the JSON object, no other text:"""
             f"Failed to extract features after {max_retries} attempts: {str(last_error)}"
         )
 
+    async def aextract_car_features(
+        self, user_input: str, max_retries: int = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of extract_car_features using Gemini's async client.
+
+        Does not block the event loop while waiting on the Gemini round-trip,
+        so concurrent requests can overlap their network I/O.
+
+        Args:
+            user_input: User's car description
+            max_retries: Maximum number of retry attempts (default: from config.LLM_MAX_RETRIES)
+
+        Returns:
+            Dictionary with extracted features (nulls for missing values)
+
+        Raises:
+            ValueError: If extraction fails after all retries
+        """
+        if not user_input or not user_input.strip():
+            raise ValueError("User input cannot be empty")
+
+        if max_retries is None:
+            max_retries = LLM_MAX_RETRIES
+
+        cached = self.get_cached_features(user_input)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_extraction_prompt(user_input)
+
+        # Try extraction with retries
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                logger.debug(f"Extraction attempt {attempt + 1}/{max_retries}")
+
+                # Call Gemini API (non-blocking)
+                response = await self.model.generate_content_async(
+                    prompt, generation_config=_EXTRACTION_CONFIG
+                )
+                response_text = response.text.strip()
+
+                # Parse JSON and fill defaults and estimates
+                features = self._parse_json_response(response_text)
+                features = self._fill_missing_features(features)
+                self._cache_features(user_input, features)
+
+                logger.debug("Feature extraction successful")
+                return features
+
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    f"Attempt {attempt + 1} failed: {str(e)}", exc_info=True
+                )
+
+        # All retries failed
+        raise ValueError(
+            f"Failed to extract features after {max_retries} attempts: {str(last_error)}"
+        )
+
+    async def aextract_and_summarize(self, user_input: str) -> tuple[Dict[str, Any], str]:
+        """
+        Extract car features and write the friendly summary with a single Gemini call.
+
+        Saves the second round-trip of aextract_car_features followed by
+        agenerate_friendly_response. There are no retries: callers fall back
+        to the separate calls if this fails.
+
+        Args:
+            user_input: User's car description
+
+        Returns:
+            Tuple of (features with defaults filled in, summary text)
+
+        Raises:
+            ValueError: If the input is empty or the response cannot be parsed
+        """
+        if not user_input or not user_input.strip():
+            raise ValueError("User input cannot be empty")
+
+        prompt = self._build_fused_prompt(user_input)
+
+        try:
+            response = await self.model.generate_content_async(
+                prompt, generation_config=_FUSED_CONFIG
+            )
+            parsed = self._parse_json_response(response.text.strip())
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Combined extraction call failed: {str(e)}")
+
+        features = parsed.get("features")
+        summary = parsed.get("summary")
+        if not isinstance(features, dict) or not isinstance(summary, str) or not summary.strip():
+            raise ValueError("Combined response is missing 'features' or 'summary'")
+
+        features = self._fill_missing_features(features)
+        self._cache_features(user_input, features)
+
+        logger.debug("Combined extraction and summary successful")
+        return features, summary.strip()
+
+    async def aextract_car_features_batch(
+        self, user_inputs: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Extract features for several descriptions with a single Gemini call.
+
+        Falls back to one aextract_car_features call per input (with the
+        usual retries) if the batched response cannot be parsed.
+
+        Args:
+            user_inputs: User car descriptions
+
+        Returns:
+            One entry per input, in order: the extracted features, or the
+            exception raised while extracting that input
+        """
+        # Only send descriptions that are not cached yet
+        results: List[Any] = [self.get_cached_features(user_input) for user_input in user_inputs]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        if len(pending) < len(user_inputs):
+            extracted = await self.aextract_car_features_batch([user_inputs[i] for i in pending])
+            for i, result in zip(pending, extracted):
+                results[i] = result
+            return results
+
+        if len(user_inputs) == 1:
+            return await asyncio.gather(
+                self.aextract_car_features(user_inputs[0]), return_exceptions=True
+            )
+
+        try:
+            if any(not user_input or not user_input.strip() for user_input in user_inputs):
+                raise ValueError("User input cannot be empty")
+
+            prompt = self._build_batch_extraction_prompt(user_inputs)
+            response = await self.model.generate_content_async(
+                prompt, generation_config=_BATCH_EXTRACTION_CONFIG
+            )
+            items = self._parse_json_array_response(response.text, len(user_inputs))
+
+            logger.debug(f"Batched feature extraction successful ({len(user_inputs)} inputs)")
+            results = [self._fill_missing_features(features) for features in items]
+            for user_input, features in zip(user_inputs, results):
+                self._cache_features(user_input, features)
+            return results
+
+        except Exception as e:
+            logger.warning(
+                f"Batched extraction failed, falling back to single calls: {str(e)}"
+            )
+            return await asyncio.gather(
+                *(self.aextract_car_features(user_input) for user_input in user_inputs),
+                return_exceptions=True,
+            )
+
+    def _parse_json_array_response(self, response_text: str, expected_len: int) -> list:
+        """
+        Parse a JSON array from a batched LLM response.
+
+        Args:
+            response_text: Raw response text from LLM
+            expected_len: Number of items the array must contain
+
+        Returns:
+            Parsed list
+
+        Raises:
+            ValueError: If parsing fails or the array has the wrong length
+        """
+        match = _JSON_ARRAY.search(response_text)
+        if match is None:
+            raise ValueError("No JSON array found in response")
+
+        try:
+            items = orjson.loads(match.group())
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {str(e)}")
+
+        if not isinstance(items, list) or len(items) != expected_len:
+            raise ValueError(f"Expected a JSON array with {expected_len} items")
+
+        return items
+
     def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
         """
         Parse JSON from LLM response.
@@ -222,31 +665,14 @@ Return ONLY the JSON object, no other text:"""
         Raises:
             ValueError: If JSON parsing fails
         """
-        # Try to extract JSON from response (in case LLM adds extra text)
-        response_text = response_text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```"):
-            lines = response_text.split("\n")
-            # Remove first and last lines if they're code fences
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines[-1].startswith("```"):
-                lines = lines[:-1]
-            response_text = "\n".join(lines).strip()
-
-        # Try to find JSON object
-        start_idx = response_text.find("{")
-        end_idx = response_text.rfind("}") + 1
-
-        if start_idx == -1 or end_idx == 0:
+        # Outermost {...} span; skips any markdown fences or extra text around it
+        match = _JSON_OBJECT.search(response_text)
+        if match is None:
             raise ValueError("No JSON object found in response")
 
-        json_str = response_text[start_idx:end_idx]
-
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
+            return orjson.loads(match.group())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {str(e)}")
 
     def _fill_missing_features(self, features: Dict[str, Any]) -> Dict[str, Any]:
@@ -269,10 +695,14 @@ Return ONLY the JSON object, no other text:"""
         if features.get("mileage") is None:
             features["mileage"] = DEFAULT_MILEAGE
 
-        # Set null categorical features from constants
+        # Set null categorical features from constants, and map values outside
+        # the valid lists (e.g. from a non-schema fallback reply) to 'others'
         for field, default_value in CATEGORICAL_DEFAULTS.items():
-            if features.get(field) is None:
+            value = features.get(field)
+            if value is None:
                 features[field] = default_value
+            else:
+                features[field] = validate_categorical(value, _CATEGORICAL_SETS[field], field)
 
         # Set null binary features to 0 (assume no accidents, not one owner, etc.)
         for binary_field in ["accidents_or_damage", "one_owner", "personal_use_only"]:
@@ -285,6 +715,48 @@ Return ONLY the JSON object, no other text:"""
 
         return features
 
+    def _build_friendly_prompt(self, user_description: str, warnings: list[str]) -> str:
+        """
+        Build the prompt for the friendly summary.
+
+        Args:
+            user_description: Original user description
+            warnings: List of warning messages
+
+        Returns:
+            Formatted prompt string
+        """
+        # Build warnings section
+        warnings_text = "\n".join(f"- {w}" for w in warnings) if warnings else "None - all information was provided"
+
+        return (
+            f"{_FRIENDLY_PROMPT_HEAD}{user_description}"
+            f"{_FRIENDLY_PROMPT_MIDDLE}{warnings_text}{_FRIENDLY_PROMPT_TAIL}"
+        )
+
+    def templated_summary(self, warnings: list[str]) -> Optional[str]:
+        """
+        Get a fixed summary if no LLM call is needed for these warnings.
+
+        Returns:
+            The complete-information summary when the only warnings are the
+            seller defaults (and LLM_SKIP_SUMMARY_WHEN_NO_WARNINGS is set),
+            otherwise None
+        """
+        if LLM_SKIP_SUMMARY_WHEN_NO_WARNINGS and SELLER_DEFAULT_WARNINGS.issuperset(warnings):
+            logger.debug("All car details provided, using the templated summary")
+            return _COMPLETE_INFO_SUMMARY
+        return None
+
+    def _build_fallback_summary(
+        self, price_min: int, price_max: int, warnings: list[str]
+    ) -> str:
+        """Build a simple summary used when the LLM call fails."""
+        fallback = f"Based on your description, the estimated price range is ${price_min:,} to ${price_max:,}."
+        if warnings:
+            fallback += f"\n\nNote: {warnings[0]}"
+        return fallback
+
     def generate_friendly_response(
         self,
         user_description: str,
@@ -304,41 +776,188 @@ Return ONLY the JSON object, no other text:"""
         Returns:
             Human-friendly summary text
         """
-        # Build warnings section
-        warnings_text = "\n".join(f"- {w}" for w in warnings) if warnings else "None - all information was provided"
-
-        prompt = f"""You are a friendly car pricing assistant. Based on the user's car description and our price analysis, write a natural, helpful summary.
+        summary = self.templated_summary(warnings)
+        if summary is not None:
+            return summary
 
-**User's Description:**
-"{user_description}"
+        prompt = self._build_friendly_prompt(user_description, warnings)
 
-**Considerations:**
-{warnings_text}
+        try:
+            response = self.model.generate_content(
+                prompt, generation_config=_SUMMARY_CONFIG
+            )
+            friendly_text = response.text.strip()
+            logger.debug("Friendly response generated successfully")
+            return friendly_text
 
-**Instructions:**
-Write a concise 2 paragraph response with this structure:
+        except Exception as e:
+            logger.error(f"Failed to generate friendly response: {str(e)}", exc_info=True)
+            # Simple fallback
+            return self._build_fallback_summary(price_min, price_max, warnings)
 
-**Paragraph 1:** Start with a simple greeting (like "Hello" or "Hi there"), then mention that using the information provided and a machine learning model, we estimated the value. DO NOT repeat the actual price numbers - they are shown separately. Just mention that the estimate was made.
+    async def agenerate_friendly_response(
+        self,
+        user_description: str,
+        price_min: int,
+        price_max: int,
+        warnings: list[str],
+    ) -> str:
+        """
+        Async version of generate_friendly_response using Gemini's async client.
 
-**Paragraph 2:** If there are considerations/warnings, explain them in user-friendly, natural language. If no considerations exist (all info was provided), just add a brief positive note about having complete information for an accurate estimate. Don't forget to explain the assumtipons made (e.g., mileage, condition), when they apply.
+        Args:
+            user_description: Original user description
+            price_min: Minimum price in range
+            price_max: Maximum price in range
+            warnings: List of warning messages
 
-Keep it warm but concise. Don't repeat back all the features the user already told you. Write directly to the user ("your car", "based on your description").
+        Returns:
+            Human-friendly summary text
+        """
+        summary = self.templated_summary(warnings)
+        if summary is not None:
+            return summary
 
-Generate the response:"""
+        prompt = self._build_friendly_prompt(user_description, warnings)
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(
+                prompt, generation_config=_SUMMARY_CONFIG
+            )
             friendly_text = response.text.strip()
-            logger.info("Friendly response generated successfully")
+            logger.debug("Friendly response generated successfully")
             return friendly_text
 
         except Exception as e:
             logger.error(f"Failed to generate friendly response: {str(e)}", exc_info=True)
             # Simple fallback
-            fallback = f"Based on your description, the estimated price range is ${price_min:,} to ${price_max:,}."
-            if warnings:
-                fallback += f"\n\nNote: {warnings[0]}"
-            return fallback
+            return self._build_fallback_summary(price_min, price_max, warnings)
+
+    async def astream_friendly_response(
+        self,
+        user_description: str,
+        price_min: int,
+        price_max: int,
+        warnings: list[str],
+    ) -> AsyncIterator[str]:
+        """
+        Stream the friendly summary as Gemini generates it.
+
+        Args:
+            user_description: Original user description
+            price_min: Minimum price in range
+            price_max: Maximum price in range
+            warnings: List of warning messages
+
+        Yields:
+            Chunks of the summary text. If generation fails before anything was
+            sent, the fallback summary is yielded instead.
+        """
+        summary = self.templated_summary(warnings)
+        if summary is not None:
+            yield summary
+            return
+
+        prompt = self._build_friendly_prompt(user_description, warnings)
+        sent_any = False
+
+        try:
+            response = await self.model.generate_content_async(
+                prompt, generation_config=_SUMMARY_CONFIG, stream=True
+            )
+            async for chunk in response:
+                text = chunk.text
+                if text:
+                    sent_any = True
+                    yield text
+            logger.debug("Friendly response streamed successfully")
+
+        except Exception as e:
+            logger.error(f"Failed to stream friendly response: {str(e)}", exc_info=True)
+            if not sent_any:
+                yield self._build_fallback_summary(price_min, price_max, warnings)
+
+    def _build_batch_friendly_prompt(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Build a single prompt that writes friendly summaries for several predictions.
+
+        Args:
+            requests: Dicts with user_description and warnings keys
+
+        Returns:
+            Formatted prompt string asking for a JSON array of strings
+        """
+        sections = []
+        for i, request in enumerate(requests, 1):
+            warnings = request["warnings"]
+            warnings_text = "\n".join(f"- {w}" for w in warnings) if warnings else "None - all information was provided"
+            sections.append(
+                f"""### Car {i}
+**User's Description:**
+"{request['user_description']}"
+
+**Considerations:**
+{warnings_text}"""
+            )
+        cars = "\n\n".join(sections)
+
+        count = len(requests)
+        return (
+            f"{_BATCH_FRIENDLY_PROMPT_HEAD}{count}{_BATCH_FRIENDLY_PROMPT_MIDDLE}{cars}"
+            f"{_BATCH_FRIENDLY_PROMPT_TAIL}{count}{_BATCH_FRIENDLY_PROMPT_END}"
+        )
+
+    async def agenerate_friendly_responses_batch(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Generate friendly summaries for several predictions with a single Gemini call.
+
+        Falls back to one agenerate_friendly_response call per request if the
+        batched response cannot be parsed.
+
+        Args:
+            requests: Dicts with the agenerate_friendly_response keyword arguments
+                (user_description, price_min, price_max, warnings)
+
+        Returns:
+            One summary per request, in order
+        """
+        if len(requests) == 1:
+            return [await self.agenerate_friendly_response(**requests[0])]
+
+        try:
+            prompt = self._build_batch_friendly_prompt(requests)
+            response = await self.model.generate_content_async(
+                prompt, generation_config=_BATCH_SUMMARY_CONFIG
+            )
+            summaries = self._parse_json_array_response(response.text, len(requests))
+
+            logger.debug(f"Batched friendly responses generated ({len(requests)} inputs)")
+            return [str(summary).strip() for summary in summaries]
+
+        except Exception as e:
+            logger.warning(
+                f"Batched friendly responses failed, falling back to single calls: {str(e)}"
+            )
+            return await asyncio.gather(
+                *(self.agenerate_friendly_response(**request) for request in requests)
+            )
+
+    async def aembed_text(self, text: str) -> List[float]:
+        """
+        Get an embedding vector for a text using Gemini's embedding endpoint.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        result = await genai.embed_content_async(
+            model=GEMINI_EMBEDDING_MODEL, content=text
+        )
+        return result["embedding"]
 
 
 # Convenience function for testing
@@ -9,24 +9,42 @@ The saved model is a scikit-learn Pipeline that includes:
 
 import joblib
 import logging
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Union
+import numpy as np
 import pandas as pd
 
-from backend.app.constants import MODEL_FEATURES
+from backend.app.config import MODEL_PREDICTION_CACHE_SIZE
+from backend.app.constants import MODEL_FEATURES, FEATURE_TYPES
+from backend.app.services.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Column dtypes of the validated features (see CarFeatures). Pinning them lets
+# the DataFrame be built column by column without dtype inference.
+_FLOAT_FEATURES = frozenset({'mpg', 'seller_rating', 'driver_rating'})
+_FEATURE_DTYPES = {
+    name: (
+        object if FEATURE_TYPES[name] == 'categorical'
+        else np.float64 if name in _FLOAT_FEATURES
+        else np.int64
+    )
+    for name in MODEL_FEATURES
+}
+
 
 class ModelService:
     """Service for loading the model pipeline and making predictions."""
 
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, cache_size: int = None):
         """
         Initialize model service and load the pipeline.
 
         Args:
             model_path: Path to the pickled model file
+            cache_size: Number of raw predictions kept per feature set
+                (default: from config.MODEL_PREDICTION_CACHE_SIZE, 0 disables)
 
         Raises:
             FileNotFoundError: If model file doesn't exist
@@ -34,20 +52,72 @@ class ModelService:
         """
         self.model_path = Path(model_path)
         self.model = None
+        self._preprocessor = None
+        self._booster = None
+        self._iteration_range = (0, 0)
         self._load_model()
+        self._split_pipeline()
+        self._last_used_ts = time.monotonic()
+
+        if cache_size is None:
+            cache_size = MODEL_PREDICTION_CACHE_SIZE
+        # Identical feature sets (e.g. similar descriptions that fill in the
+        # same defaults) skip the DataFrame build and the XGBoost pass
+        self._price_cache = LRUCache(cache_size) if cache_size > 0 else None
+
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the model was loaded or last used for a prediction."""
+        return time.monotonic() - self._last_used_ts
 
     def _load_model(self):
-        """Load the model pipeline using joblib."""
+        """
+        Load the model pipeline using joblib.
+
+        The XGBoost booster is stored as a serialized byte blob and is rebuilt
+        in native memory on load, so each process that loads the model holds
+        its own copy. Processes only share it when forked after loading
+        (gunicorn --preload, see PRELOAD_MODEL), via copy-on-write.
+        """
         if not self.model_path.exists():
             raise FileNotFoundError(f"Model file not found: {self.model_path}")
 
         try:
+            start = time.perf_counter()
             self.model = joblib.load(self.model_path)
-            logger.info(f"Model loaded successfully from {self.model_path}")
+            logger.info(
+                f"Model loaded successfully from {self.model_path} "
+                f"in {(time.perf_counter() - start) * 1000:.0f} ms"
+            )
         except Exception as e:
             logger.error(f"Failed to load model: {str(e)}")
             raise
 
+    def _split_pipeline(self):
+        """
+        Keep the preprocessing steps and the raw XGBoost booster for predict.
+
+        Calling Booster.inplace_predict on the transformed features skips the
+        sklearn/XGBRegressor predict wrappers (input validation, DMatrix
+        setup). If the model is not a Pipeline ending in an XGBoost
+        estimator, predictions go through model.predict as before.
+        """
+        steps = getattr(self.model, "steps", None)
+        if not steps or not hasattr(steps[-1][1], "get_booster"):
+            logger.info("Model is not a Pipeline ending in XGBoost; using model.predict")
+            return
+
+        regressor = steps[-1][1]
+        self._preprocessor = self.model[:-1] if len(steps) > 1 else None
+        self._booster = regressor.get_booster()
+
+        # Match XGBRegressor.predict: use the best iteration if the model was
+        # trained with early stopping, otherwise all trees
+        try:
+            self._iteration_range = (0, regressor.best_iteration + 1)
+        except AttributeError:
+            self._iteration_range = (0, 0)
+
     def predict(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make price prediction from car features.
@@ -68,54 +138,164 @@ class ModelService:
         if self.model is None:
             raise ValueError("Model not loaded")
 
+        self._last_used_ts = time.monotonic()
+
         try:
-            # Convert features dict to DataFrame with correct column order
-            df = self._features_to_dataframe(features)
+            price = self._predict_prices([self._feature_values(features)])[0]
+            result = self._price_range(price)
 
-            # Make prediction (pipeline handles all transformations)
-            prediction = self.model.predict(df)[0]
-
-            # Calculate confidence interval (±10%)
-            price = float(prediction)
-            price_min = price * 0.9
-            price_max = price * 1.1
-
-            # Round to nearest hundred (more practical for car prices)
-            result = {
-                "price": int(round(price / 100) * 100),
-                "price_min": int(round(price_min / 100) * 100),
-                "price_max": int(round(price_max / 100) * 100),
-                "confidence": 0.9,  # Simple fixed confidence for now
-            }
-
-            logger.info(f"Prediction successful: ${result['price']:,.2f}")
+            logger.debug(f"Prediction successful: ${result['price']:,.2f}")
             return result
 
         except Exception as e:
             logger.error(f"Prediction failed: {str(e)}", exc_info=True)
             raise ValueError(f"Prediction failed: {str(e)}")
 
-    def _features_to_dataframe(self, features: Dict[str, Any]) -> pd.DataFrame:
+    def predict_batch(
+        self, features_list: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
         """
-        Convert features dictionary to DataFrame with correct column order.
+        Make price predictions for several cars with a single pipeline pass.
+
+        Falls back to one predict call per car if the batched pass fails, so
+        one bad feature set does not fail the others.
 
         Args:
-            features: Dictionary with feature values
+            features_list: Feature dictionaries (all 14 required features each)
 
         Returns:
-            DataFrame with single row and columns in MODEL_FEATURES order
+            One entry per input, in order: the predict() result, or the
+            ValueError raised for that input
+        """
+        if self.model is None:
+            return [ValueError("Model not loaded")] * len(features_list)
+
+        self._last_used_ts = time.monotonic()
+
+        results: List[Any] = [None] * len(features_list)
+        pending = []
+        for i, features in enumerate(features_list):
+            try:
+                pending.append((i, self._feature_values(features)))
+            except ValueError as e:
+                results[i] = ValueError(f"Prediction failed: {str(e)}")
+
+        if pending:
+            try:
+                prices = self._predict_prices([values for _, values in pending])
+            except Exception as e:
+                logger.warning(
+                    f"Batched prediction failed, falling back to single predictions: {str(e)}"
+                )
+                for i, _ in pending:
+                    try:
+                        results[i] = self.predict(features_list[i])
+                    except ValueError as single_error:
+                        results[i] = single_error
+            else:
+                for (i, _), price in zip(pending, prices):
+                    results[i] = self._price_range(price)
+
+        logger.debug(f"Batched prediction successful ({len(features_list)} inputs)")
+        return results
+
+    def _feature_values(self, features: Dict[str, Any]) -> tuple:
+        """
+        Get the feature values in MODEL_FEATURES order (hashable cache key).
 
         Raises:
             ValueError: If required features are missing
         """
-        # Check all required features are present
-        missing = [f for f in MODEL_FEATURES if f not in features]
-        if missing:
+        try:
+            return tuple(features[name] for name in MODEL_FEATURES)
+        except KeyError:
+            # Check all required features are present
+            missing = [f for f in MODEL_FEATURES if f not in features]
             raise ValueError(f"Missing required features: {missing}")
 
+    def _predict_prices(self, rows: List[tuple]) -> List[float]:
+        """
+        Get raw predicted prices, running the pipeline once for all uncached rows.
+
+        Args:
+            rows: Feature values in MODEL_FEATURES order, one tuple per car
+
+        Returns:
+            Raw predicted prices, one per row
+        """
+        prices: List[Optional[float]] = [None] * len(rows)
+        misses = []
+        for i, values in enumerate(rows):
+            if self._price_cache is not None:
+                try:
+                    prices[i] = self._price_cache.get(values)
+                except TypeError:
+                    # Unhashable values can't be cached
+                    pass
+            if prices[i] is None:
+                misses.append(i)
+
+        if misses:
+            # Convert features to DataFrame with correct column order
+            df = self._features_to_dataframe([rows[i] for i in misses])
+
+            # Make prediction (pipeline handles all transformations)
+            predictions = self._run_pipeline(df)
+
+            for i, prediction in zip(misses, predictions):
+                prices[i] = float(prediction)
+                if self._price_cache is not None:
+                    try:
+                        self._price_cache.set(rows[i], prices[i])
+                    except TypeError:
+                        pass
+
+        return prices
+
+    def _run_pipeline(self, df: pd.DataFrame):
+        """Run preprocessing and the XGBoost booster (or the whole model) on a DataFrame."""
+        if self._booster is None:
+            return self.model.predict(df)
+
+        X = self._preprocessor.transform(df) if self._preprocessor is not None else df
+        return self._booster.inplace_predict(X, iteration_range=self._iteration_range)
+
+    def _price_range(self, price: float) -> Dict[str, Any]:
+        """Build the rounded price range result for a raw predicted price."""
+        # Calculate confidence interval (±10%)
+        price_min = price * 0.9
+        price_max = price * 1.1
+
+        # Round to nearest hundred (more practical for car prices)
+        return {
+            "price": int(round(price / 100) * 100),
+            "price_min": int(round(price_min / 100) * 100),
+            "price_max": int(round(price_max / 100) * 100),
+            "confidence": 0.9,  # Simple fixed confidence for now
+        }
+
+    def _features_to_dataframe(self, rows: List[tuple]) -> pd.DataFrame:
+        """
+        Convert feature values to a DataFrame with correct column order.
+
+        The pipeline's ColumnTransformer selects columns by name, so it needs a
+        DataFrame rather than a bare array. The frame is built from one typed
+        array per column, which skips pandas' row-wise construction and dtype
+        inference.
+
+        Args:
+            rows: Feature values in MODEL_FEATURES order, one tuple per car
+
+        Returns:
+            DataFrame with one row per car and columns in MODEL_FEATURES order
+        """
         # Create DataFrame with features in correct order
         # This is critical - XGBoost expects features in the training order
-        df = pd.DataFrame([features], columns=MODEL_FEATURES)
+        columns = {
+            name: np.array(column, dtype=dtype)
+            for (name, dtype), column in zip(_FEATURE_DTYPES.items(), zip(*rows))
+        }
+        df = pd.DataFrame(columns, copy=False)
 
         logger.debug(f"Created DataFrame with shape {df.shape}")
         return df
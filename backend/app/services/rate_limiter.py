@@ -8,15 +8,28 @@ or when the application restarts.
 from datetime import datetime, timezone
 from typing import Optional
 import logging
+import multiprocessing
+import time
 
 logger = logging.getLogger(__name__)
 
+# Slots of the shared state array
+_DAY = 0
+_COUNT = 1
+
+_SECONDS_PER_DAY = 86400
+
 
 class DailyRateLimiter:
     """
     Simple in-memory rate limiter that tracks daily request counts.
 
-    Thread-safe for single-process applications.
+    The counter lives in shared memory guarded by a process-shared lock, so
+    it is safe across threads and across worker processes forked after the
+    limiter is created (gunicorn --preload): all workers then count against
+    the same daily limit. Use try_acquire() on the hot path: it checks and
+    counts a request in one step, so concurrent requests cannot both pass the
+    check before either one increments the counter.
     """
 
     def __init__(self, max_requests_per_day: int = 30):
@@ -27,22 +40,54 @@ class DailyRateLimiter:
             max_requests_per_day: Maximum number of requests allowed per day
         """
         self.max_requests_per_day = max_requests_per_day
-        self.request_count = 0
-        self.current_date: Optional[str] = None
+        # [UTC day number, request count]; day -1 means "not started yet"
+        self._state = multiprocessing.RawArray("q", [-1, 0])
+        self._lock = multiprocessing.Lock()
         logger.info(f"Rate limiter initialized: {max_requests_per_day} requests/day")
 
-    def _get_current_date(self) -> str:
-        """Get current date in UTC as string (YYYY-MM-DD)."""
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    @property
+    def request_count(self) -> int:
+        """Requests counted so far today."""
+        return self._state[_COUNT]
+
+    @property
+    def current_date(self) -> Optional[str]:
+        """Date (YYYY-MM-DD, UTC) the counter belongs to, or None before the first request."""
+        day = self._state[_DAY]
+        if day < 0:
+            return None
+        return datetime.fromtimestamp(day * _SECONDS_PER_DAY, timezone.utc).strftime("%Y-%m-%d")
+
+    def _get_current_day(self) -> int:
+        """Get current UTC day as a day number (days since the epoch)."""
+        return int(time.time() // _SECONDS_PER_DAY)
 
     def _reset_if_new_day(self) -> None:
-        """Reset counter if it's a new day."""
-        today = self._get_current_date()
+        """Reset counter if it's a new day (call with the lock held)."""
+        today = self._get_current_day()
+
+        if self._state[_DAY] != today:
+            logger.info(f"New day detected. Resetting counter from {self._state[_COUNT]} to 0")
+            self._state[_COUNT] = 0
+            self._state[_DAY] = today
+
+    def try_acquire(self) -> bool:
+        """
+        Check the rate limit and count the request if it is allowed.
+
+        Returns:
+            True if request is allowed (and was counted), False if limit exceeded
+        """
+        with self._lock:
+            self._reset_if_new_day()
+            count = self._state[_COUNT]
+            if count >= self.max_requests_per_day:
+                return False
+            count += 1
+            self._state[_COUNT] = count
 
-        if self.current_date != today:
-            logger.info(f"New day detected. Resetting counter from {self.request_count} to 0")
-            self.request_count = 0
-            self.current_date = today
+        logger.debug(f"Request count: {count}/{self.max_requests_per_day}")
+        return True
 
     def is_allowed(self) -> bool:
         """
@@ -51,14 +96,17 @@ class DailyRateLimiter:
         Returns:
             True if request is allowed, False if limit exceeded
         """
-        self._reset_if_new_day()
-        return self.request_count < self.max_requests_per_day
+        with self._lock:
+            self._reset_if_new_day()
+            return self._state[_COUNT] < self.max_requests_per_day
 
     def increment(self) -> None:
         """Increment the request counter."""
-        self._reset_if_new_day()
-        self.request_count += 1
-        logger.info(f"Request count: {self.request_count}/{self.max_requests_per_day}")
+        with self._lock:
+            self._reset_if_new_day()
+            count = self._state[_COUNT] + 1
+            self._state[_COUNT] = count
+        logger.debug(f"Request count: {count}/{self.max_requests_per_day}")
 
     def get_remaining(self) -> int:
         """
@@ -67,8 +115,9 @@ class DailyRateLimiter:
         Returns:
             Number of remaining requests
         """
-        self._reset_if_new_day()
-        remaining = max(0, self.max_requests_per_day - self.request_count)
+        with self._lock:
+            self._reset_if_new_day()
+            remaining = max(0, self.max_requests_per_day - self._state[_COUNT])
         return remaining
 
     def get_status(self) -> dict:
@@ -78,10 +127,12 @@ class DailyRateLimiter:
         Returns:
             Dictionary with current status information
         """
-        self._reset_if_new_day()
+        with self._lock:
+            self._reset_if_new_day()
+            used = self._state[_COUNT]
         return {
             "limit": self.max_requests_per_day,
-            "used": self.request_count,
-            "remaining": self.get_remaining(),
+            "used": used,
+            "remaining": max(0, self.max_requests_per_day - used),
             "date": self.current_date,
         }
@@ -4,15 +4,11 @@ Validation service using Pydantic for type safety and data validation.
 Validates car features before prediction and generates user-friendly warnings.
 """
 
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from backend.app.constants import (
-    MANUFACTURERS,
-    TRANSMISSIONS,
-    DRIVETRAINS,
-    FUEL_TYPES,
-    INTERIOR_COLORS,
     YEAR_MIN,
     YEAR_MAX,
     MILEAGE_MIN,
@@ -22,18 +18,57 @@ from backend.app.constants import (
     DEFAULT_SELLER_RATING,
     DEFAULT_DRIVER_RATING,
     DEFAULT_DRIVER_REVIEWS_NUM,
+    MPG_TABLE,
 )
 
+# Warnings for the seller features, which are always filled with defaults
+SELLER_RATING_WARNING = "Using default seller rating (average seller quality)"
+DRIVER_RATING_WARNING = "Using default driver rating (average driver quality)"
+DRIVER_REVIEWS_WARNING = "Using default driver reviews count"
+SELLER_DEFAULT_WARNINGS = frozenset({
+    SELLER_RATING_WARNING,
+    DRIVER_RATING_WARNING,
+    DRIVER_REVIEWS_WARNING,
+})
+
+# (field, value, warning): warn when the field holds that value. Default
+# seller values first, then categorical fields that fell back to "others"
+_VALUE_WARNINGS = (
+    ("seller_rating", DEFAULT_SELLER_RATING, SELLER_RATING_WARNING),
+    ("driver_rating", DEFAULT_DRIVER_RATING, DRIVER_RATING_WARNING),
+    ("driver_reviews_num", DEFAULT_DRIVER_REVIEWS_NUM, DRIVER_REVIEWS_WARNING),
+) + tuple(
+    (field, "others", f"Unknown {display_name} - using generic category")
+    for field, display_name in (
+        ("manufacturer", "manufacturer"),
+        ("transmission", "transmission"),
+        ("drivetrain", "drivetrain"),
+        ("fuel_type", "fuel type"),
+        ("interior_color", "interior color"),
+    )
+)
+
+# MPG values estimate_mpg produces for gasoline cars (22.5, 25.0, 27.5)
+_ESTIMATED_GASOLINE_MPG = frozenset(
+    mpg for (fuel_type, _), mpg in MPG_TABLE.items() if fuel_type == "Gasoline"
+)
+MPG_ESTIMATED_WARNING = "MPG was estimated based on fuel type and year"
+
 
 class CarFeatures(BaseModel):
     """Pydantic model for validating car features."""
 
+    # Drop unknown keys (e.g. extra fields from the LLM) instead of storing
+    # them, so the validated __dict__ holds exactly the model features
+    model_config = ConfigDict(extra="ignore")
+
     # Binary features
     accidents_or_damage: int = Field(ge=0, le=1, description="0=No, 1=Yes")
     one_owner: int = Field(ge=0, le=1, description="0=No, 1=Yes")
     personal_use_only: int = Field(ge=0, le=1, description="0=No, 1=Yes")
 
-    # Categorical features
+    # Categorical features (values outside the valid lists are passed through;
+    # the pipeline's encoder ignores unknown categories)
     manufacturer: str = Field(description="Car manufacturer")
     transmission: str = Field(description="Transmission type")
     drivetrain: str = Field(description="Drivetrain type")
@@ -50,95 +85,70 @@ class CarFeatures(BaseModel):
     seller_rating: float = Field(ge=0, le=5, description="Seller rating")
     driver_rating: float = Field(ge=0, le=5, description="Driver rating")
 
-    @field_validator('manufacturer')
-    @classmethod
-    def validate_manufacturer(cls, v):
-        """Validate manufacturer is in allowed list."""
-        if v not in MANUFACTURERS:
-            # Pipeline will handle unknown values, just pass through
-            return v
-        return v
-
-    @field_validator('transmission')
-    @classmethod
-    def validate_transmission(cls, v):
-        """Validate transmission is in allowed list."""
-        if v not in TRANSMISSIONS:
-            return v
-        return v
-
-    @field_validator('drivetrain')
-    @classmethod
-    def validate_drivetrain(cls, v):
-        """Validate drivetrain is in allowed list."""
-        if v not in DRIVETRAINS:
-            return v
-        return v
-
-    @field_validator('fuel_type')
-    @classmethod
-    def validate_fuel_type(cls, v):
-        """Validate fuel type is in allowed list."""
-        if v not in FUEL_TYPES:
-            return v
-        return v
-
-    @field_validator('interior_color')
-    @classmethod
-    def validate_interior_color(cls, v):
-        """Validate interior color is in allowed list."""
-        if v not in INTERIOR_COLORS:
-            return v
-        return v
-
-
-def validate_features(features: dict) -> tuple[CarFeatures, List[str]]:
+
+# Built once; validates plain dicts straight into CarFeatures
+_CAR_FEATURES_ADAPTER = TypeAdapter(CarFeatures)
+
+
+def validate_features(features: dict) -> tuple[dict, List[str]]:
     """
     Validate car features and generate warnings.
 
+    Results are memoized per feature set: many descriptions extract to the
+    same features, so repeats skip validation entirely.
+
     Args:
         features: Dictionary with car features
 
     Returns:
-        Tuple of (validated CarFeatures object, list of warning messages)
+        Tuple of (validated feature dict, list of warning messages)
 
     Raises:
         ValidationError: If features are invalid
     """
-    warnings = []
+    try:
+        validated, warnings = _validate_frozen(tuple(sorted(features.items())))
+    except TypeError:
+        # Unhashable values (e.g. a list from a malformed LLM response)
+        validated, warnings = _validate(features)
+
+    # Callers own their copies; the cached entry must stay untouched
+    return dict(validated), list(warnings)
+
 
-    # Check if defaults were used
-    if features.get("seller_rating") == DEFAULT_SELLER_RATING:
-        warnings.append("Using default seller rating (average seller quality)")
+@lru_cache(maxsize=2048)
+def _validate_frozen(items: tuple) -> tuple[dict, tuple]:
+    """Memoized _validate keyed by the sorted feature items."""
+    validated, warnings = _validate(dict(items))
+    # Cache the warnings as a tuple so a cached entry can't be mutated
+    return validated, tuple(warnings)
 
-    if features.get("driver_rating") == DEFAULT_DRIVER_RATING:
-        warnings.append("Using default driver rating (average driver quality)")
 
-    if features.get("driver_reviews_num") == DEFAULT_DRIVER_REVIEWS_NUM:
-        warnings.append("Using default driver reviews count")
+def _validate(features: dict) -> tuple[dict, List[str]]:
+    """Validate car features and generate warnings (uncached)."""
+    warnings = _warnings(features)
 
-    # Check for "others" in categorical fields
-    categorical_fields = {
-        "manufacturer": "manufacturer",
-        "transmission": "transmission",
-        "drivetrain": "drivetrain",
-        "fuel_type": "fuel type",
-        "interior_color": "interior color",
-    }
+    # Validate using Pydantic (dict in, no **kwargs unpacking).
+    # The model's __dict__ already holds the validated (coerced) field values,
+    # so hand it out directly instead of building a copy with model_dump().
+    validated = _CAR_FEATURES_ADAPTER.validate_python(features)
 
-    for field, display_name in categorical_fields.items():
-        if features.get(field) == "others":
-            warnings.append(f"Unknown {display_name} - using generic category")
+    return validated.__dict__, warnings
+
+
+def _warnings(features: dict) -> List[str]:
+    """Generate the user-facing warnings for a feature set."""
+    get = features.get
+
+    # Defaults used and unknown categories, built in one pass
+    warnings = [warning for field, value, warning in _VALUE_WARNINGS if get(field) == value]
 
     # Check if MPG was estimated (approximate check)
     # We can't know for sure if it was estimated, but we can warn about it
-    if features.get("fuel_type") == "Gasoline" and features.get("mpg") in [22.5, 25.0, 27.5]:
-        warnings.append("MPG was estimated based on fuel type and year")
-
-    # Validate using Pydantic
-    validated = CarFeatures(**features)
+    if get("fuel_type") == "Gasoline" and get("mpg") in _ESTIMATED_GASOLINE_MPG:
+        warnings.append(MPG_ESTIMATED_WARNING)
 
-    return validated, warnings
+    return warnings
 
 
 def get_validation_summary(features: dict) -> dict:
@@ -149,18 +159,19 @@ def get_validation_summary(features: dict) -> dict:
         features: Dictionary with car features
 
     Returns:
-        Dictionary with validation results and warnings
+        Dictionary with validation results and warnings. For invalid
+        features, "error" holds Pydantic's structured error list.
     """
     try:
         validated, warnings = validate_features(features)
         return {
             "valid": True,
             "warnings": warnings,
-            "features": validated.model_dump(),
+            "features": validated,
         }
-    except Exception as e:
+    except ValidationError as e:
         return {
             "valid": False,
-            "error": str(e),
+            "error": e.errors(include_url=False),
             "warnings": [],
         }
@@ -38,8 +38,8 @@ async function handleSubmit(e) {
     submitBtn.disabled = true;
 
     try {
-        // Call prediction API
-        const response = await fetch(`${API_BASE_URL}/predict`, {
+        // Call streaming prediction API (newline-delimited JSON events)
+        const response = await fetch(`${API_BASE_URL}/predict/stream`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -47,14 +47,12 @@ async function handleSubmit(e) {
             body: JSON.stringify({ description }),
         });
 
-        const data = await response.json();
-
         if (!response.ok) {
+            const data = await response.json();
             throw new Error(data.detail || 'Failed to get prediction');
         }
 
-        // Display results
-        displayResults(data);
+        await readPredictionStream(response);
 
     } catch (error) {
         console.error('Error:', error);
@@ -65,6 +63,37 @@ async function handleSubmit(e) {
     }
 }
 
+/**
+ * Read prediction events from a streaming response
+ */
+async function readPredictionStream(response) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+
+        for (const line of lines) {
+            if (!line.trim()) continue;
+            const message = JSON.parse(line);
+
+            if (message.event === 'prediction') {
+                // Price is ready before the summary: show it right away
+                loadingDiv.classList.add('hidden');
+                displayResults({ ...message.data, friendly_summary: '' });
+            } else if (message.event === 'summary_delta') {
+                friendlySummaryEl.textContent += message.data;
+            }
+        }
+    }
+}
+
 /**
  * Display prediction results
  */
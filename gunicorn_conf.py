@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for serving the app with Uvicorn workers.
+
+The app (and the ML model) is loaded once in the gunicorn master process and
+then forked, so all workers share the model's memory pages copy-on-write.
+
+Run from project root:
+    gunicorn -c gunicorn_conf.py backend.app.main:app
+
+Note: workers share the rate limiter (created in the master), but the caches
+are in-memory, so each worker keeps its own.
+"""
+
+import os
+
+# Load the model at import time, in the master (see backend/app/config.py)
+os.environ.setdefault("PRELOAD_MODEL", "true")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+# First requests can wait on Gemini for a while
+timeout = 120
@@ -9,12 +9,16 @@ Then run this script:
 """
 
 import requests
-import json
+import orjson
 from typing import Dict, Any
 
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One session for all tests so requests reuse pooled connections
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+
 
 def print_response(title: str, response: requests.Response):
     """Pretty print API response."""
@@ -24,7 +28,7 @@ def print_response(title: str, response: requests.Response):
     print(f"Status Code: {response.status_code}")
     print(f"\nResponse:")
     try:
-        print(json.dumps(response.json(), indent=2))
+        print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
     except Exception:
         print(response.text)
     print(f"{'='*80}\n")
@@ -33,7 +37,7 @@ def print_response(title: str, response: requests.Response):
 def test_health_check():
     """Test the health check endpoint."""
     print("\n🔍 Testing Health Check Endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print_response("Health Check", response)
     return response.status_code == 200
 
@@ -46,10 +50,9 @@ def test_prediction(description: str):
         "description": description
     }
 
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/predict",
         json=payload,
-        headers={"Content-Type": "application/json"}
     )
 
     print_response(f"Prediction for: {description[:60]}", response)
@@ -64,10 +67,9 @@ def test_empty_description():
         "description": ""
     }
 
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/predict",
         json=payload,
-        headers={"Content-Type": "application/json"}
     )
 
     print_response("Empty Description Error", response)
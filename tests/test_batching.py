@@ -0,0 +1,250 @@
+"""
+Unit tests for micro-batching (MicroBatcher and batched LLM extraction).
+
+No API key or network needed; Gemini is replaced by a fake model.
+
+Run from project root:
+    python -m unittest tests.test_batching
+"""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+import orjson
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.batching import MicroBatcher
+from backend.app.services.cache import LRUCache
+from backend.app.services.llm_service import LLMService
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """Stands in for genai.GenerativeModel; answers each prompt with respond(prompt)."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.prompts = []
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        return FakeResponse(self.respond(prompt))
+
+
+class MicroBatcherTest(unittest.IsolatedAsyncioTestCase):
+    """Batch dispatch, result fan-out and cancellation in MicroBatcher."""
+
+    async def asyncSetUp(self):
+        self.batches = []
+
+    async def _echo(self, items):
+        self.batches.append(list(items))
+        return [item * 10 for item in items]
+
+    async def _start(self, process_batch, **kwargs):
+        batcher = MicroBatcher(process_batch, **kwargs)
+        await batcher.start()
+        self.addAsyncCleanup(batcher.stop)
+        return batcher
+
+    async def test_submit_before_start_raises(self):
+        batcher = MicroBatcher(self._echo)
+        with self.assertRaises(RuntimeError):
+            await batcher.submit(1)
+
+    async def test_flushes_full_batches_without_waiting(self):
+        batcher = await self._start(self._echo, max_batch_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+        )
+
+        self.assertEqual(results, [0, 10, 20, 30])
+        self.assertEqual(self.batches, [[0, 1], [2, 3]])
+
+    async def test_flushes_partial_batch_after_max_wait(self):
+        batcher = await self._start(self._echo, max_batch_size=8, max_wait_ms=20)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3))), timeout=1
+        )
+
+        self.assertEqual(results, [0, 10, 20])
+        self.assertEqual(self.batches, [[0, 1, 2]])
+
+    async def test_exception_results_raise_for_their_item_only(self):
+        async def process(items):
+            return [ValueError(f"bad {item}") if item % 2 else item for item in items]
+
+        batcher = await self._start(process, max_batch_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.gather(
+            batcher.submit(0), batcher.submit(1), return_exceptions=True
+        )
+
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(str(results[1]), "bad 1")
+
+    async def test_batch_failure_raises_for_every_item(self):
+        async def process(items):
+            raise ConnectionError("Gemini unavailable")
+
+        batcher = await self._start(process, max_batch_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.gather(
+            batcher.submit(0), batcher.submit(1), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+
+    async def test_wrong_result_count_raises(self):
+        async def process(items):
+            return items[:-1]
+
+        batcher = await self._start(process, max_batch_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.gather(
+            batcher.submit(0), batcher.submit(1), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    async def test_cancelled_caller_does_not_break_the_batch(self):
+        release = asyncio.Event()
+
+        async def process(items):
+            await release.wait()
+            return items
+
+        batcher = await self._start(process, max_batch_size=2, max_wait_ms=10_000)
+
+        cancelled = asyncio.create_task(batcher.submit("cancelled"))
+        kept = asyncio.create_task(batcher.submit("kept"))
+        await asyncio.sleep(0.01)  # both items are in the dispatched batch
+
+        cancelled.cancel()
+        release.set()
+
+        self.assertEqual(await asyncio.wait_for(kept, timeout=1), "kept")
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+
+
+    async def test_stop_fails_undispatched_items(self):
+        batcher = await self._start(self._echo, max_batch_size=8, max_wait_ms=10_000)
+
+        # Queued, not yet picked up by the collector
+        queued = [asyncio.create_task(batcher.submit(i)) for i in range(2)]
+        await asyncio.sleep(0)
+        await batcher.stop()
+
+        for task in queued:
+            with self.assertRaisesRegex(RuntimeError, "stopped"):
+                await asyncio.wait_for(task, timeout=1)
+        self.assertEqual(self.batches, [])
+
+    async def test_stop_fails_partially_collected_batch(self):
+        batcher = await self._start(self._echo, max_batch_size=8, max_wait_ms=10_000)
+
+        # Picked up by the collector, which is waiting for the batch to fill
+        collected = [asyncio.create_task(batcher.submit(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+
+        for task in collected:
+            with self.assertRaisesRegex(RuntimeError, "stopped"):
+                await asyncio.wait_for(task, timeout=1)
+        self.assertEqual(self.batches, [])
+
+    async def test_stop_lets_dispatched_batches_finish(self):
+        batcher = await self._start(self._echo, max_batch_size=2, max_wait_ms=10_000)
+
+        dispatched = asyncio.gather(batcher.submit(1), batcher.submit(2))
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+
+        self.assertEqual(await dispatched, [10, 20])
+
+
+class BatchExtractionTest(unittest.IsolatedAsyncioTestCase):
+    """LLMService.aextract_car_features_batch with a fake Gemini model."""
+
+    def setUp(self):
+        self.service = LLMService(api_key="test-key", cache=LRUCache(16))
+
+    def _use_model(self, respond):
+        self.service.model = FakeGeminiModel(respond)
+        return self.service.model
+
+    async def test_only_uncached_descriptions_are_sent(self):
+        self.service._cache_features("2002 Ford", {"year": 2002})
+        model = self._use_model(
+            lambda prompt: orjson.dumps([{"year": 2001}, {"year": 2003}]).decode()
+        )
+
+        results = await self.service.aextract_car_features_batch(
+            ["2001 Honda", "2002 Ford", "2003 BMW"]
+        )
+
+        self.assertEqual([r["year"] for r in results], [2001, 2002, 2003])
+        self.assertEqual(len(model.prompts), 1)
+        self.assertIn('"2001 Honda"', model.prompts[0])
+        self.assertIn('"2003 BMW"', model.prompts[0])
+        self.assertNotIn('"2002 Ford"', model.prompts[0])
+
+        # Newly extracted features are cached for the next request
+        self.assertEqual(self.service.get_cached_features("2003 BMW")["year"], 2003)
+
+    async def test_all_cached_makes_no_call(self):
+        self.service._cache_features("2002 Ford", {"year": 2002})
+        model = self._use_model(lambda prompt: self.fail("unexpected Gemini call"))
+
+        results = await self.service.aextract_car_features_batch(["2002 Ford"])
+
+        self.assertEqual(results, [{"year": 2002}])
+        self.assertEqual(model.prompts, [])
+
+    async def test_unparseable_batch_falls_back_to_single_calls(self):
+        def respond(prompt):
+            if "independently" in prompt:
+                return "not json"
+            year = 2001 if "2001 Honda" in prompt else 2003
+            return orjson.dumps({"year": year}).decode()
+
+        model = self._use_model(respond)
+
+        with self.assertLogs("backend.app.services.llm_service", level="WARNING"):
+            results = await self.service.aextract_car_features_batch(["2001 Honda", "2003 BMW"])
+
+        self.assertEqual([r["year"] for r in results], [2001, 2003])
+        self.assertEqual(len(model.prompts), 3)  # one batched + two single calls
+
+    async def test_single_call_errors_are_returned_per_item(self):
+        self.service.cache = None
+
+        def respond(prompt):
+            if "independently" in prompt or "2003 BMW" in prompt:
+                return "not json"
+            return orjson.dumps({"year": 2001}).decode()
+
+        self._use_model(respond)
+
+        with self.assertLogs("backend.app.services.llm_service", level="WARNING"):
+            results = await self.service.aextract_car_features_batch(["2001 Honda", "2003 BMW"])
+
+        self.assertEqual(results[0]["year"], 2001)
+        self.assertIsInstance(results[1], ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the prediction caches (LRUCache and PredictionCache).
+
+Run from project root:
+    python -m unittest tests.test_cache
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.cache import LRUCache, PredictionCache, normalize_description
+
+# Fixed embeddings per normalized description; "camry" and "camry!" are near-identical
+EMBEDDINGS = {
+    "camry": [1.0, 0.0, 0.0],
+    "camry!": [0.99, 0.1, 0.0],
+    "civic": [0.0, 1.0, 0.0],
+    "f-150": [0.0, 0.0, 1.0],
+    "model 3": [0.7, 0.7, 0.0],
+}
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        evicted = []
+        cache = LRUCache(maxsize=2, on_evict=evicted.append)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        self.assertEqual(evicted, ["b"])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+
+class PredictionCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.embed_calls = []
+
+    async def _embed(self, text):
+        self.embed_calls.append(text)
+        return EMBEDDINGS[text]
+
+    def _cache(self, maxsize=4, semantic=True):
+        return PredictionCache(
+            maxsize=maxsize,
+            embed_fn=self._embed if semantic else None,
+            similarity_threshold=0.97,
+        )
+
+    def _assert_slots_consistent(self, cache):
+        """Every cached result owns exactly one matrix row; all other rows are free."""
+        used = sorted(cache._slots.values())
+        self.assertEqual(sorted(used + cache._free_slots), list(range(len(cache._slot_keys))))
+        for key, slot in cache._slots.items():
+            self.assertEqual(cache._slot_keys[slot], key)
+            self.assertIsNotNone(cache._results.get(key))
+        for slot in cache._free_slots:
+            self.assertIsNone(cache._slot_keys[slot])
+            self.assertFalse(cache._matrix[slot].any())
+
+    async def test_exact_hit_ignores_case_and_whitespace(self):
+        cache = self._cache(semantic=False)
+        await cache.aset("2020  Toyota Camry", {"price": 1})
+
+        self.assertEqual(await cache.aget("2020 toyota camry "), {"price": 1})
+        self.assertIsNone(await cache.aget("2020 Honda Civic"))
+
+    async def test_semantic_hit_above_threshold_only(self):
+        cache = self._cache()
+        await cache.aset("Camry", {"price": 1})
+
+        self.assertEqual(await cache.aget("camry!"), {"price": 1})
+        self.assertIsNone(await cache.aget("model 3"))
+
+    async def test_embedding_computed_once_per_description(self):
+        cache = self._cache()
+        await cache.aset("camry", {"price": 1})
+        await cache.aget("civic")
+        await cache.aget("civic")
+
+        self.assertEqual(self.embed_calls, ["camry", "civic"])
+
+    async def test_eviction_releases_matrix_row(self):
+        cache = self._cache(maxsize=2)
+        await cache.aset("camry", {"price": 1})
+        await cache.aset("civic", {"price": 2})
+        await cache.aset("f-150", {"price": 3})  # evicts "camry"
+
+        self._assert_slots_consistent(cache)
+        self.assertEqual(len(cache._slots), 2)
+        # The evicted result can't be served through its old embedding
+        self.assertIsNone(await cache.aget("camry!"))
+        self.assertEqual(await cache.aget("f-150"), {"price": 3})
+
+    async def test_freed_rows_are_reused(self):
+        cache = self._cache(maxsize=2)
+        for description in ["camry", "civic", "f-150", "model 3", "camry"]:
+            await cache.aset(description, {"price": description})
+            self._assert_slots_consistent(cache)
+
+        self.assertEqual(await cache.aget("camry!"), {"price": "camry"})
+        self.assertIsNone(await cache.aget("civic"))
+
+    async def test_embedding_failure_keeps_exact_tier(self):
+        async def failing_embed(text):
+            raise ConnectionError("embedding service down")
+
+        cache = PredictionCache(maxsize=2, embed_fn=failing_embed)
+        with self.assertLogs("backend.app.services.cache", level="WARNING"):
+            await cache.aset("camry", {"price": 1})
+            self.assertIsNone(await cache.aget("camry!"))
+
+        self.assertEqual(await cache.aget("camry"), {"price": 1})
+
+    def test_normalize_description(self):
+        self.assertEqual(normalize_description("  2020\tToyota\nCAMRY "), "2020 toyota camry")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the combined extract+summary Gemini call and its fallback.
+
+No API key or network needed; Gemini is replaced by a fake model.
+
+Run from project root:
+    python -m unittest tests.test_fused_extraction
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import orjson
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.api import endpoints
+from backend.app.services.batching import BatchingLLMService
+from backend.app.services.cache import LRUCache
+from backend.app.services.llm_service import LLMService
+from tests.test_batching import FakeGeminiModel
+
+FUSED_MARKER = "JSON object with two keys"
+
+
+def fused_reply(features, summary="  Hi there! Nice car.  "):
+    return orjson.dumps({"features": features, "summary": summary}).decode()
+
+
+class FusedExtractionTest(unittest.IsolatedAsyncioTestCase):
+    """LLMService.aextract_and_summarize and endpoints._aextract_with_summary."""
+
+    def setUp(self):
+        self.service = LLMService(api_key="test-key", cache=LRUCache(16))
+
+        # The endpoint helper uses the module-level service
+        previous = endpoints.llm_service
+        endpoints.llm_service = self.service
+        self.addCleanup(setattr, endpoints, "llm_service", previous)
+
+    def _use_model(self, respond):
+        self.service.model = FakeGeminiModel(respond)
+        return self.service.model
+
+    async def test_well_formed_response(self):
+        model = self._use_model(lambda prompt: fused_reply({"year": 2019, "mileage": 30000}))
+
+        features, summary = await self.service.aextract_and_summarize("2019 Camry, 30k miles")
+
+        self.assertEqual((features["year"], features["mileage"]), (2019, 30000))
+        self.assertEqual(features["seller_rating"], 4.5)  # defaults filled in
+        self.assertEqual(summary, "Hi there! Nice car.")
+        self.assertEqual(len(model.prompts), 1)
+        self.assertIn(FUSED_MARKER, model.prompts[0])
+        self.assertEqual(self.service.get_cached_features("2019 camry, 30K miles"), features)
+
+    async def test_malformed_or_partial_response_raises(self):
+        replies = [
+            "not json",
+            '{"features": {"year": 2019}, "summary": "cut o',
+            orjson.dumps({"features": {"year": 2019}}).decode(),
+            fused_reply({"year": 2019}, summary="   "),
+        ]
+        for reply in replies:
+            with self.subTest(reply=reply):
+                self._use_model(lambda prompt: reply)
+                with self.assertRaises(ValueError):
+                    await self.service.aextract_and_summarize("2019 Camry")
+        self.assertIsNone(self.service.get_cached_features("2019 Camry"))
+
+    async def test_endpoint_returns_fused_summary(self):
+        self._use_model(lambda prompt: fused_reply({"year": 2019}))
+
+        features, summary = await endpoints._aextract_with_summary("2019 Camry")
+
+        self.assertEqual(features["year"], 2019)
+        self.assertEqual(summary, "Hi there! Nice car.")
+
+    async def test_endpoint_falls_back_to_plain_extraction(self):
+        def respond(prompt):
+            if FUSED_MARKER in prompt:
+                return '{"features": {"year": 2019}'  # truncated
+            return orjson.dumps({"year": 2019}).decode()
+
+        model = self._use_model(respond)
+
+        with self.assertLogs("backend.app.api.endpoints", level="WARNING"):
+            features, summary = await endpoints._aextract_with_summary("2019 Camry")
+
+        self.assertEqual(features["year"], 2019)
+        self.assertIsNone(summary)  # generated by the separate summary step
+        self.assertEqual(len(model.prompts), 2)
+        self.assertNotIn(FUSED_MARKER, model.prompts[1])
+
+    async def test_endpoint_cache_hit_skips_the_call(self):
+        self._use_model(lambda prompt: fused_reply({"year": 2019}))
+        first, _ = await endpoints._aextract_with_summary("2019 Camry")
+
+        model = self._use_model(lambda prompt: self.fail("unexpected Gemini call"))
+        features, summary = await endpoints._aextract_with_summary("  2019 CAMRY")
+
+        self.assertEqual(features, first)
+        self.assertIsNone(summary)
+        self.assertEqual(model.prompts, [])
+
+    async def test_batching_wrapper_extracts_through_the_batcher(self):
+        model = self._use_model(lambda prompt: orjson.dumps({"year": 2019}).decode())
+        batching = BatchingLLMService(self.service, max_batch_size=4, max_wait_ms=1)
+        await batching.start()
+        self.addAsyncCleanup(batching.stop)
+
+        features, summary = await batching.aextract_and_summarize("2019 Camry")
+
+        self.assertEqual(features["year"], 2019)
+        self.assertIsNone(summary)
+        self.assertNotIn(FUSED_MARKER, model.prompts[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
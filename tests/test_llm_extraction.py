@@ -6,12 +6,16 @@ Run from project root:
 
 Or run specific example:
     python tests/test_llm_extraction.py --example 5
+
+Examples run concurrently; use --concurrency and --rate to stay within the
+Gemini quota.
 """
 
 import os
 import sys
-import json
+import orjson
 import argparse
+import asyncio
 import time
 from pathlib import Path
 from datetime import datetime
@@ -301,24 +305,26 @@ TEST_EXAMPLES = [
 ]
 
 
-def test_extraction_example(llm_service, input_text, expected_output, example_num, output_lines):
-    """Test a single extraction example."""
-    def log(msg):
-        """Print and save to output lines."""
-        print(msg)
-        output_lines.append(msg)
+async def test_extraction_example(llm_service, input_text, expected_output, example_num, output_lines):
+    """
+    Test a single extraction example.
+
+    Lines are only collected in output_lines (not printed), so concurrent
+    examples can be printed in order once they finish.
+    """
+    log = output_lines.append
 
     log(f"\n{'='*80}")
     log(f"EXAMPLE {example_num}")
     log(f"{'='*80}")
     log(f"\nInput: {input_text}")
     log(f"\nExpected Output (user-provided features only):")
-    log(json.dumps(expected_output, indent=2))
+    log(orjson.dumps(expected_output, option=orjson.OPT_INDENT_2).decode())
 
     try:
-        actual_output = llm_service.extract_car_features(input_text)
+        actual_output = await llm_service.aextract_car_features(input_text)
         log(f"\nActual Output (with all defaults filled):")
-        log(json.dumps(actual_output, indent=2))
+        log(orjson.dumps(actual_output, option=orjson.OPT_INDENT_2).decode())
 
         # Compare only the fields that were in expected_output
         log(f"\n--- Comparison (user-provided features) ---")
@@ -352,6 +358,46 @@ def test_extraction_example(llm_service, input_text, expected_output, example_nu
         return False
 
 
+class StartRateLimiter:
+    """Spaces out request starts to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Wait until the next request may start."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def run_examples(llm_service, examples, concurrency, rate):
+    """
+    Run (example_num, input_text, expected_output) examples concurrently.
+
+    Returns:
+        List of (example_num, passed, output_lines), in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = StartRateLimiter(rate)
+
+    async def run_one(example_num, input_text, expected_output):
+        lines = []
+        async with semaphore:
+            await limiter.wait()
+            passed = await test_extraction_example(
+                llm_service, input_text, expected_output, example_num, lines
+            )
+        return example_num, passed, lines
+
+    return await asyncio.gather(*(run_one(*example) for example in examples))
+
+
 def main():
     """Main test runner."""
     parser = argparse.ArgumentParser(description="Test LLM feature extraction")
@@ -367,6 +413,18 @@ def main():
         help="Output file path (default: tests/results_TIMESTAMP.txt)",
         default=None
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Maximum number of examples in flight at once (default: 5)",
+        default=5
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Maximum example starts per second, 0 for no limit (default: 1)",
+        default=1.0
+    )
     args = parser.parse_args()
 
     # Prepare output file
@@ -395,33 +453,41 @@ def main():
         # Run specific example
         if 1 <= args.example <= len(TEST_EXAMPLES):
             input_text, expected_output = TEST_EXAMPLES[args.example - 1]
-            test_extraction_example(llm_service, input_text, expected_output, args.example, output_lines)
+            examples = [(args.example, input_text, expected_output)]
         else:
             log(f"ERROR: Example number must be between 1 and {len(TEST_EXAMPLES)}")
             sys.exit(1)
     else:
         # Run all examples
-        results = []
-        for i, (input_text, expected_output) in enumerate(TEST_EXAMPLES, 1):
-            result = test_extraction_example(llm_service, input_text, expected_output, i, output_lines)
-            results.append((i, result))
-
-            if i < len(TEST_EXAMPLES):
-                log("\nWaiting 3 seconds before next example...")
-                time.sleep(3)
-
+        examples = [
+            (i, input_text, expected_output)
+            for i, (input_text, expected_output) in enumerate(TEST_EXAMPLES, 1)
+        ]
+        log(f"Running {len(examples)} examples "
+            f"(concurrency={args.concurrency}, rate={args.rate}/s)...")
+
+    start = time.perf_counter()
+    results = asyncio.run(run_examples(llm_service, examples, args.concurrency, args.rate))
+    elapsed = time.perf_counter() - start
+
+    for _, _, lines in results:
+        for line in lines:
+            log(line)
+
+    if not args.example:
         # Summary
         log(f"\n{'='*80}")
         log("SUMMARY")
         log(f"{'='*80}")
-        passed = sum(1 for _, result in results if result)
+        passed = sum(1 for _, result, _ in results if result)
         total = len(results)
         log(f"\nPassed: {passed}/{total}")
         log(f"Failed: {total - passed}/{total}")
+        log(f"Elapsed: {elapsed:.1f}s")
 
         if total - passed > 0:
             log("\nFailed examples:")
-            for num, result in results:
+            for num, result, _ in results:
                 if not result:
                     log(f"  - Example {num}")
 
@@ -0,0 +1,88 @@
+"""
+Unit tests for ModelService batch prediction, using the trained model in models/.
+
+Run from project root:
+    python -m unittest tests.test_model_service
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.config import MODEL_PATH
+from backend.app.services.model_service import ModelService
+
+CAMRY = {
+    "accidents_or_damage": 0,
+    "one_owner": 1,
+    "personal_use_only": 1,
+    "manufacturer": "Toyota",
+    "transmission": "Automatic",
+    "drivetrain": "front_wheel_drive",
+    "fuel_type": "Gasoline",
+    "interior_color": "Black",
+    "year": 2020,
+    "mileage": 45000,
+    "mpg": 32.0,
+    "driver_reviews_num": 64,
+    "seller_rating": 4.5,
+    "driver_rating": 4.7,
+}
+F150 = {**CAMRY, "manufacturer": "Ford", "year": 2015, "mileage": 120000, "mpg": 18.0}
+
+
+@unittest.skipUnless(MODEL_PATH.exists(), f"model file not found: {MODEL_PATH}")
+class PredictBatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ModelService(model_path=str(MODEL_PATH), cache_size=0)
+
+    def test_matches_single_predictions(self):
+        results = self.service.predict_batch([CAMRY, F150])
+
+        self.assertEqual(results, [self.service.predict(CAMRY), self.service.predict(F150)])
+
+    def test_missing_features_fail_only_that_input(self):
+        incomplete = {k: v for k, v in CAMRY.items() if k != "mileage"}
+
+        results = self.service.predict_batch([CAMRY, incomplete, F150])
+
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIn("mileage", str(results[1]))
+        self.assertEqual(results[0], self.service.predict(CAMRY))
+        self.assertEqual(results[2], self.service.predict(F150))
+
+    def test_failed_batched_pass_falls_back_to_single_predictions(self):
+        # A non-numeric mileage breaks the batched DataFrame build for everyone
+        bad = {**CAMRY, "mileage": "lots"}
+
+        with self.assertLogs("backend.app.services.model_service", level="WARNING") as logs:
+            results = self.service.predict_batch([CAMRY, bad, F150])
+
+        self.assertTrue(any("falling back" in line for line in logs.output))
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[0], self.service.predict(CAMRY))
+        self.assertEqual(results[2], self.service.predict(F150))
+
+    def test_price_cache_serves_repeats(self):
+        service = ModelService(model_path=str(MODEL_PATH), cache_size=8)
+        first = service.predict_batch([CAMRY])
+
+        service._run_pipeline = None  # any pipeline call would now fail
+        self.assertEqual(service.predict_batch([CAMRY]), first)
+
+    def test_unloaded_model_fails_every_input(self):
+        service = ModelService.__new__(ModelService)
+        service.model = None
+
+        results = service.predict_batch([CAMRY, F150])
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Unit tests for the shared daily rate limiter.
+
+Run from project root:
+    python -m unittest tests.test_rate_limiter
+"""
+
+import multiprocessing
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.rate_limiter import DailyRateLimiter
+
+DAY = 20_000  # 2024-10-04 as a UTC day number
+
+
+def _acquire_many(limiter: DailyRateLimiter, attempts: int) -> None:
+    """Child process: try to acquire `attempts` times, exit code = number granted."""
+    granted = sum(limiter.try_acquire() for _ in range(attempts))
+    sys.exit(granted)
+
+
+class DailyRateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.limiter = DailyRateLimiter(max_requests_per_day=3)
+        patcher = mock.patch.object(self.limiter, "_get_current_day", return_value=DAY)
+        self.today = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_refuses_at_the_limit(self):
+        self.assertEqual([self.limiter.try_acquire() for _ in range(5)], [True, True, True, False, False])
+        self.assertEqual(self.limiter.request_count, 3)
+        self.assertFalse(self.limiter.is_allowed())
+        self.assertEqual(
+            self.limiter.get_status(),
+            {"limit": 3, "used": 3, "remaining": 0, "date": "2024-10-04"},
+        )
+
+    def test_resets_on_a_new_day(self):
+        for _ in range(3):
+            self.limiter.try_acquire()
+        self.assertFalse(self.limiter.try_acquire())
+
+        self.today.return_value = DAY + 1
+
+        self.assertEqual(self.limiter.get_remaining(), 3)
+        self.assertTrue(self.limiter.try_acquire())
+        self.assertEqual(self.limiter.request_count, 1)
+        self.assertEqual(self.limiter.current_date, "2024-10-05")
+
+    def test_no_date_before_first_request(self):
+        self.assertIsNone(DailyRateLimiter().current_date)
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "needs the fork start method"
+    )
+    def test_forked_processes_share_one_limit(self):
+        # Like gunicorn --preload: created in the parent, used by forked workers
+        limiter = DailyRateLimiter(max_requests_per_day=50)
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_acquire_many, args=(limiter, 20)) for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+
+        self.assertEqual(sum(worker.exitcode for worker in workers), 50)
+        self.assertEqual(limiter.request_count, 50)
+        self.assertFalse(limiter.try_acquire())
+
+
+if __name__ == "__main__":
+    unittest.main()
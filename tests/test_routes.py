@@ -0,0 +1,39 @@
+"""
+Regression test for the registered API routes (no server or API key needed).
+
+Guards against duplicate or missing route modules being included.
+
+Run from project root:
+    python -m unittest tests.test_routes
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.main import app
+
+EXPECTED_ROUTES = {
+    "/": {"get"},
+    "/api/v1/health": {"get"},
+    "/api/v1/predict": {"post"},
+    "/api/v1/predict/stream": {"post"},
+}
+
+
+class RoutesTest(unittest.TestCase):
+    def test_exactly_the_expected_routes(self):
+        paths = app.openapi()["paths"]
+
+        self.assertEqual(
+            {path: set(methods) for path, methods in paths.items()},
+            EXPECTED_ROUTES,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for feature validation and its memoization.
+
+Run from project root:
+    python -m unittest tests.test_validation
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from pydantic import ValidationError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.services.validation import (
+    MPG_ESTIMATED_WARNING,
+    SELLER_DEFAULT_WARNINGS,
+    _validate_frozen,
+    get_validation_summary,
+    validate_features,
+)
+
+FEATURES = {
+    "accidents_or_damage": 0,
+    "one_owner": 1,
+    "personal_use_only": 1,
+    "manufacturer": "Toyota",
+    "transmission": "others",
+    "drivetrain": "front_wheel_drive",
+    "fuel_type": "Gasoline",
+    "interior_color": "Black",
+    "year": 2020,
+    "mileage": 45000,
+    "mpg": 27.5,
+    "driver_reviews_num": 64,
+    "seller_rating": 4.5,
+    "driver_rating": 4.7,
+}
+
+
+class ValidateFeaturesTest(unittest.TestCase):
+    def setUp(self):
+        _validate_frozen.cache_clear()
+
+    def test_warnings(self):
+        _, warnings = validate_features(FEATURES)
+
+        self.assertEqual(
+            set(warnings),
+            SELLER_DEFAULT_WARNINGS
+            | {"Unknown transmission - using generic category", MPG_ESTIMATED_WARNING},
+        )
+
+    def test_coerces_values(self):
+        validated, _ = validate_features({**FEATURES, "year": "2015", "mpg": 30})
+
+        self.assertEqual(validated["year"], 2015)
+        self.assertIsInstance(validated["mpg"], float)
+
+    def test_repeat_calls_hit_the_memo(self):
+        validate_features(FEATURES)
+        validate_features(dict(reversed(FEATURES.items())))  # key order doesn't matter
+
+        self.assertEqual(_validate_frozen.cache_info().hits, 1)
+
+    def test_repeat_calls_return_independent_copies(self):
+        first, first_warnings = validate_features(FEATURES)
+        first["year"] = 1999
+        first_warnings.clear()
+
+        second, second_warnings = validate_features(FEATURES)
+
+        self.assertEqual(_validate_frozen.cache_info().hits, 1)
+        self.assertEqual(second["year"], 2020)
+        self.assertTrue(second_warnings)
+        self.assertIsNot(first, second)
+
+    def test_unhashable_values_skip_the_memo(self):
+        # Unknown keys are ignored by CarFeatures, even unhashable ones
+        validated, warnings = validate_features({**FEATURES, "notes": ["clean title"]})
+
+        self.assertEqual((validated, warnings), validate_features(FEATURES))
+        self.assertNotIn("notes", validated)
+        self.assertEqual(_validate_frozen.cache_info().currsize, 1)
+
+    def test_unhashable_invalid_value_still_raises(self):
+        with self.assertRaises(ValidationError):
+            validate_features({**FEATURES, "manufacturer": ["Toyota"]})
+
+    def test_invalid_features_raise(self):
+        with self.assertRaises(ValidationError):
+            validate_features({**FEATURES, "year": 1800})
+
+
+class ValidationSummaryTest(unittest.TestCase):
+    def test_valid(self):
+        summary = get_validation_summary(FEATURES)
+
+        self.assertTrue(summary["valid"])
+        self.assertEqual(summary["features"]["year"], 2020)
+
+    def test_invalid_reports_structured_errors(self):
+        summary = get_validation_summary({**FEATURES, "mileage": -1})
+
+        self.assertFalse(summary["valid"])
+        self.assertEqual([e["loc"] for e in summary["error"]], [("mileage",)])
+        self.assertEqual(summary["warnings"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()